@@ -16,9 +16,9 @@ from collections import defaultdict
 
 # Import shared database connection
 from database import get_connection, DB_PATH
+from settings_store import SETTINGS_FILE, write_settings
 
-# Settings and log files
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
+# Log file
 TUNING_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tuning_log.json')
 
 
@@ -42,8 +42,7 @@ def load_settings():
 def save_settings(settings):
     """Save scanner settings"""
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         return True
     except Exception as e:
         print(f"⚠️  Error saving settings: {e}")
@@ -440,22 +440,26 @@ def get_recent_performance(days=7):
     }
 
 
+# Sections of the full analytics payload, in response order
+ANALYTICS_SECTIONS = (
+    ("win_rate_chart", lambda: get_win_rate_chart_data(30)),
+    ("pnl_chart", lambda: get_pnl_chart_data(30)),
+    ("tickers", get_ticker_performance),
+    ("hourly", get_hourly_distribution),
+    ("weekday", get_weekday_distribution),
+    ("streaks", get_streak_info),
+    ("confidence", get_confidence_performance),
+    ("direction", get_direction_performance),
+    ("recent_7d", lambda: get_recent_performance(7)),
+    ("recent_30d", lambda: get_recent_performance(30)),
+)
+
+
 def get_full_analytics():
     """
     Get all analytics data in one call
     """
-    return {
-        "win_rate_chart": get_win_rate_chart_data(30),
-        "pnl_chart": get_pnl_chart_data(30),
-        "tickers": get_ticker_performance(),
-        "hourly": get_hourly_distribution(),
-        "weekday": get_weekday_distribution(),
-        "streaks": get_streak_info(),
-        "confidence": get_confidence_performance(),
-        "direction": get_direction_performance(),
-        "recent_7d": get_recent_performance(7),
-        "recent_30d": get_recent_performance(30)
-    }
+    return {name: build() for name, build in ANALYTICS_SECTIONS}
 
 
 print("✅ Analytics engine loaded")
@@ -0,0 +1,111 @@
+"""
+Candle Ring Buffer
+Fixed-capacity columnar candle store for one ticker/timeframe.
+
+OHLCV values live in a preallocated (capacity, 5) float64 array and times
+in a parallel list, written through a ring pointer - no per-candle dict.
+Iteration and indexing still hand back candle dicts so callers that
+expect a deque of dicts (MTF analyzer, outcome tracker) keep working.
+"""
+
+import numpy as np
+
+# Column order inside the OHLCV array
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+class CandleRing:
+    """Ring buffer of candles stored column-wise"""
+
+    __slots__ = ('maxlen', 'times', 'ohlcv', 'n', 'idx')
+
+    def __init__(self, maxlen, candles=None):
+        self.maxlen = maxlen
+        self.times = [""] * maxlen
+        self.ohlcv = np.zeros((maxlen, 5), dtype=np.float64)
+        self.n = 0      # Number of candles held
+        self.idx = 0    # Next write position
+        if candles:
+            self.extend(candles)
+
+    def append_values(self, t, o, h, l, c, v):
+        """Append one candle from raw values, overwriting the oldest when full"""
+        i = self.idx
+        self.times[i] = t
+        row = self.ohlcv[i]
+        row[OPEN] = o
+        row[HIGH] = h
+        row[LOW] = l
+        row[CLOSE] = c
+        row[VOLUME] = v
+        self.idx = (i + 1) % self.maxlen
+        if self.n < self.maxlen:
+            self.n += 1
+
+    def append(self, candle):
+        """Append a candle dict"""
+        self.append_values(
+            candle.get('time', ''), candle.get('open', 0), candle.get('high', 0),
+            candle.get('low', 0), candle.get('close', 0), candle.get('volume', 0)
+        )
+
+    def extend(self, candles):
+        for candle in candles:
+            self.append(candle)
+
+    def clear(self):
+        self.n = 0
+        self.idx = 0
+
+    @property
+    def wrapped(self):
+        return self.n == self.maxlen and self.idx != 0
+
+    def view(self):
+        """OHLCV rows oldest -> newest (a copy only when the ring has wrapped)"""
+        if self.wrapped:
+            return np.roll(self.ohlcv, -self.idx, axis=0)
+        return self.ohlcv[:self.n]
+
+    def time_list(self):
+        """Candle times oldest -> newest"""
+        if self.wrapped:
+            return self.times[self.idx:] + self.times[:self.idx]
+        return self.times[:self.n]
+
+    def last_time(self):
+        """Time of the newest candle ('' when empty)"""
+        return self.times[self.idx - 1] if self.n else ""
+
+    def tail(self, count):
+        """Last `count` candles as (times, ohlcv rows), oldest first"""
+        count = min(count, self.n)
+        if count == 0:
+            return [], self.ohlcv[:0]
+        positions = [(self.idx - count + k) % self.maxlen for k in range(count)]
+        return [self.times[p] for p in positions], self.ohlcv[positions]
+
+    def _position(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("candle index out of range")
+        return (self.idx - self.n + i) % self.maxlen
+
+    def _candle_at(self, pos):
+        o, h, l, c, v = self.ohlcv[pos].tolist()
+        return {'time': self.times[pos], 'open': o, 'high': h,
+                'low': l, 'close': c, 'volume': int(v)}
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._candle_at(self._position(k)) for k in range(*i.indices(self.n))]
+        return self._candle_at(self._position(i))
+
+    def __iter__(self):
+        start = self.idx - self.n
+        for k in range(self.n):
+            yield self._candle_at((start + k) % self.maxlen)
@@ -33,13 +33,40 @@ def get_connection():
     conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA busy_timeout = 10000")
+    conn.execute("PRAGMA synchronous = NORMAL")     # Safe with WAL, no fsync per commit
     return conn
 
 
+# Long-lived connection for hot dashboard reads. WAL lets these run
+# alongside writers instead of opening a fresh connection per request.
+_read_conn = None
+_read_lock = Lock()
+
+
+def get_read_connection():
+    """Get the shared read connection (opened on first use)"""
+    global _read_conn
+    if _read_conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 10000")
+        conn.execute("PRAGMA journal_mode = WAL")
+        _read_conn = conn
+    return _read_conn
+
+
+def read_query(sql, params=()):
+    """Run a SELECT on the shared read connection and return all rows"""
+    with _read_lock:
+        return get_read_connection().execute(sql, params).fetchall()
+
+
 def init_database():
     """Initialize database tables with enhanced schema"""
     with db_lock:
         conn = get_connection()
+        conn.execute("PRAGMA journal_mode = WAL")   # Persistent - readers don't block the writer
         cursor = conn.cursor()
         
         # ============================================================
@@ -405,41 +432,70 @@ def get_time_category(hour):
 
 def update_signal_outcome(signal_id, outcome, exit_price, pnl_ticks):
     """Update signal with outcome (WIN/LOSS)"""
-    with db_lock:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
+    update_signal_outcomes([(signal_id, outcome, exit_price, pnl_ticks)])
+
+
+def update_signal_outcomes(updates):
+    """
+    Apply several outcomes in one transaction.
+    updates: list of (signal_id, outcome, exit_price, pnl_ticks)
+    """
+    if not updates:
+        return
+    
+    now = datetime.now()
+    exit_time = now.strftime('%Y-%m-%d %H:%M:%S')
+    today = now.strftime('%Y-%m-%d')
+    
+    rows = []
+    wins = losses = 0
+    total_pnl = 0
+    for signal_id, outcome, exit_price, pnl_ticks in updates:
         outcome_upper = outcome.upper() if outcome else 'PENDING'
         if outcome_upper not in ('WIN', 'LOSS', 'DISCARDED'):
             outcome_upper = 'PENDING'
+        rows.append((outcome_upper, exit_price, exit_time, pnl_ticks, signal_id))
+        if outcome_upper == 'WIN':
+            wins += 1
+        elif outcome_upper == 'LOSS':
+            losses += 1
+        total_pnl += pnl_ticks or 0
+    
+    with db_lock:
+        conn = get_connection()
+        cursor = conn.cursor()
         
-        cursor.execute('''
+        cursor.executemany('''
             UPDATE signal_recommendations 
             SET outcome = ?, exit_price = ?, exit_time = ?, pnl_ticks = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        ''', (
-            outcome_upper,
-            exit_price,
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            pnl_ticks,
-            signal_id
-        ))
+        ''', rows)
         
         # Update strategy version stats
-        if outcome_upper in ('WIN', 'LOSS'):
-            cursor.execute(f'''
+        if wins or losses:
+            cursor.execute('''
                 UPDATE strategy_versions 
-                SET {outcome_upper.lower()}s = {outcome_upper.lower()}s + 1,
-                    win_rate = CAST(wins AS REAL) / NULLIF(wins + losses, 0) * 100
+                SET wins = wins + ?, losses = losses + ?,
+                    win_rate = CAST(wins + ? AS REAL) / NULLIF(wins + losses + ? + ?, 0) * 100
                 WHERE is_active = 1
-            ''')
+            ''', (wins, losses, wins, wins, losses))
+        
+        # Update daily stats (one row per day)
+        cursor.execute('''
+            UPDATE daily_stats 
+            SET wins = wins + ?, losses = losses + ?, total_pnl_ticks = total_pnl_ticks + ?,
+                total_signals = total_signals + ?
+            WHERE date = ?
+        ''', (wins, losses, total_pnl, len(rows), today))
+        if cursor.rowcount == 0:
+            cursor.execute('''
+                INSERT INTO daily_stats (date, total_signals, wins, losses, total_pnl_ticks)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (today, len(rows), wins, losses, total_pnl))
         
         conn.commit()
         conn.close()
-        
-        # Update daily stats
-        update_daily_stats(outcome_upper, pnl_ticks)
 
 
 def update_daily_stats(outcome, pnl_ticks):
@@ -499,27 +555,23 @@ def get_pending_signals():
         return [dict(row) for row in rows]
 
 
+RECENT_SIGNALS_SQL = '''
+    SELECT id, ticker, direction, entry as entry_price, stop as stop_price,
+           target as target_price, confidence_score as confidence,
+           outcome, exit_price as outcome_price, pnl_ticks,
+           recommended_at as timestamp, rationale, entry_type,
+           risk_reward_ratio, time_of_day, day_of_week
+    FROM signal_recommendations 
+    ORDER BY recommended_at DESC
+    LIMIT ?
+'''
+
+
 def get_recent_signals(limit=50):
     """Get recent signals for dashboard"""
-    with db_lock:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, ticker, direction, entry as entry_price, stop as stop_price,
-                   target as target_price, confidence_score as confidence,
-                   outcome, exit_price as outcome_price, pnl_ticks,
-                   recommended_at as timestamp, rationale, entry_type,
-                   risk_reward_ratio, time_of_day, day_of_week
-            FROM signal_recommendations 
-            ORDER BY recommended_at DESC
-            LIMIT ?
-        ''', (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+    with _read_lock:
+        rows = get_read_connection().execute(RECENT_SIGNALS_SQL, (limit,)).fetchall()
+    return [dict(row) for row in rows]
 
 
 def get_performance_stats():
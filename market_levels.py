@@ -26,6 +26,7 @@ Usage:
 
 from datetime import datetime, time, timedelta
 from collections import defaultdict
+import re
 import pytz
 
 # EST timezone for market hours
@@ -40,6 +41,15 @@ MARKET_CLOSE = time(16, 0)
 # Buffer from PDH/PDL levels (in points) - reduced from 15 to be less restrictive
 DEFAULT_PDH_PDL_BUFFER = 10
 
+# Contract month/year suffixes like Z2025, G2026
+CONTRACT_SUFFIX_RE = re.compile(r'[FGHJKMNQUVXZ]\d{4}$')
+
+# Max memoized bias/safety/levels results before the cache is reset
+LEVELS_CACHE_SIZE = 512
+
+# Level fields the memoized queries depend on
+SNAPSHOT_FIELDS = ('orb_high', 'orb_low', 'pdh', 'pdl', 'session_high', 'session_low')
+
 
 class MarketLevels:
     """
@@ -61,6 +71,11 @@ class MarketLevels:
         # Cache daily bias
         self.daily_bias = defaultdict(dict)  # {ticker: {date: 'LONG'/'SHORT'/'NEUTRAL'}}
         
+        # Memoized query results - keys include a per-ticker version that is
+        # bumped whenever that ticker's levels change, so stale entries just miss
+        self._version = defaultdict(int)
+        self._cache = {}
+        
     def _get_current_date(self):
         """Get current date in EST"""
         return datetime.now(EST).date()
@@ -69,10 +84,39 @@ class MarketLevels:
         """Get current time in EST"""
         return datetime.now(EST).time()
     
+    def invalidate(self, ticker=None):
+        """Drop memoized results for one ticker (or all after a bulk load)"""
+        if ticker is None:
+            self._cache.clear()
+        else:
+            self._version[ticker] += 1
+    
+    def _snapshot(self, ticker, date):
+        """Everything the memoized queries read for ticker on date"""
+        levels = self.levels[ticker].get(date, {})
+        return (tuple(levels.get(k) for k in SNAPSHOT_FIELDS),
+                self.orb_complete[ticker].get(date),
+                self.daily_bias[ticker].get(date))
+    
+    def _memo(self, key, compute):
+        """
+        Return the cached result for key, computing it on a miss.
+        Keys carry the date and ORB-complete flag since bias depends on both.
+        """
+        key = key + (self._version[key[1]], self._get_current_date(),
+                     self._get_current_time() >= ORB_END)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if len(self._cache) >= LEVELS_CACHE_SIZE:
+            self._cache.clear()
+        result = self._cache[key] = compute()
+        return result
+    
     def _normalize_ticker(self, ticker):
         """Normalize ticker symbol"""
-        import re
-        base = re.sub(r'[FGHJKMNQUVXZ]\d{4}$', '', ticker)
+        base = CONTRACT_SUFFIX_RE.sub('', ticker)
         base = base.replace('=F', '')
         return base.upper()
     
@@ -88,6 +132,8 @@ class MarketLevels:
         if not candles:
             return
         
+        before = self._snapshot(ticker, today)
+        
         # Initialize today's levels if not exist
         if today not in self.levels[ticker]:
             self.levels[ticker][today] = {
@@ -161,6 +207,11 @@ class MarketLevels:
         if current_time >= ORB_END:
             self.orb_complete[ticker][today] = True
             self._calculate_daily_bias(ticker, today)
+        
+        # Only bump the version when a level moved, otherwise the memo
+        # would miss on every webhook tick
+        if self._snapshot(ticker, today) != before:
+            self.invalidate(ticker)
     
     def set_pdh_pdl(self, ticker, pdh, pdl):
         """Manually set PDH/PDL values"""
@@ -172,6 +223,7 @@ class MarketLevels:
         
         self.levels[ticker][today]['pdh'] = pdh
         self.levels[ticker][today]['pdl'] = pdl
+        self.invalidate(ticker)
         print(f"📊 Set {ticker} PDH: {pdh}, PDL: {pdl}")
     
     def _calculate_daily_bias(self, ticker, date):
@@ -211,6 +263,10 @@ class MarketLevels:
         Returns: 'LONG', 'SHORT', or 'NEUTRAL'
         """
         ticker = self._normalize_ticker(ticker)
+        return self._memo(('bias', ticker, current_price),
+                          lambda: self._compute_daily_bias(ticker, current_price))
+    
+    def _compute_daily_bias(self, ticker, current_price):
         today = self._get_current_date()
         current_time = self._get_current_time()
         
@@ -288,6 +344,10 @@ class MarketLevels:
         Returns: (is_safe, reason)
         """
         ticker = self._normalize_ticker(ticker)
+        return self._memo(('safety', ticker, entry_price, direction),
+                          lambda: self._compute_entry_safety(ticker, entry_price, direction))
+    
+    def _compute_entry_safety(self, ticker, entry_price, direction):
         today = self._get_current_date()
         levels = self.levels[ticker].get(today, {})
         
@@ -348,6 +408,10 @@ class MarketLevels:
         Get all levels for a ticker in a formatted dict.
         """
         ticker = self._normalize_ticker(ticker)
+        return self._memo(('all', ticker, current_price),
+                          lambda: self._compute_all_levels(ticker, current_price))
+    
+    def _compute_all_levels(self, ticker, current_price):
         today = self._get_current_date()
         levels = self.levels[ticker].get(today, {})
         bias_info = self.get_daily_bias(ticker, current_price)
@@ -553,6 +617,7 @@ def load_levels_from_database():
                     market_levels.levels[ticker][today]['session_low'] = session_row['session_low']
         
         conn.close()
+        market_levels.invalidate()
         
         print("✅ Historical levels loaded from database")
         
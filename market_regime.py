@@ -130,8 +130,10 @@ def calculate_choppiness(candles, period=14):
     
     recent = candles[-period:]
     
-    # Sum of true ranges
+    # Sum of true ranges, tracking highest high / lowest low in the same pass
     tr_sum = 0
+    highest = recent[0].get('high', 0)
+    lowest = recent[0].get('low', 0)
     for i in range(1, len(recent)):
         high = recent[i].get('high', 0)
         low = recent[i].get('low', 0)
@@ -143,10 +145,11 @@ def calculate_choppiness(candles, period=14):
             abs(low - prev_close)
         )
         tr_sum += tr
-    
-    # Highest high and lowest low
-    highest = max(c.get('high', 0) for c in recent)
-    lowest = min(c.get('low', 0) for c in recent)
+        
+        if high > highest:
+            highest = high
+        if low < lowest:
+            lowest = low
     
     hl_range = highest - lowest
     if hl_range == 0:
@@ -29,6 +29,8 @@ from datetime import datetime
 import statistics
 import re
 
+from numba_compat import njit, kernel_array, NUMBA_AVAILABLE
+
 # Import time tier configuration
 try:
     from time_tiers import (
@@ -41,6 +43,66 @@ except ImportError:
     TIME_TIERS_AVAILABLE = False
     print("⚠️ time_tiers.py not found - using defaults")
 
+# ============================================
+# NUMERIC KERNELS (JIT-compiled when numba is installed)
+# ============================================
+
+@njit(cache=True)
+def _structure_counts(opens, highs, lows, closes, avg_range):
+    """Count overlapping candle pairs and wick-dominated candles"""
+    n = len(highs)
+    overlaps = 0
+    for i in range(1, n):
+        overlap = min(highs[i-1], highs[i]) - max(lows[i-1], lows[i])
+        if overlap > avg_range * 0.5:
+            overlaps += 1
+    
+    wick_dominated = 0
+    for i in range(n):
+        body = abs(closes[i] - opens[i])
+        total_range = highs[i] - lows[i]
+        if total_range > 0 and body / total_range < 0.3:
+            wick_dominated += 1
+    
+    return overlaps, wick_dominated
+
+
+@njit(cache=True)
+def _true_ranges(highs, lows, closes):
+    """True range of each candle against the previous close"""
+    n = len(highs)
+    trs = [0.0] * (n - 1)
+    for i in range(1, n):
+        high = highs[i]
+        low = lows[i]
+        prev_close = closes[i-1]
+        trs[i-1] = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    return trs
+
+
+@njit(cache=True)
+def _direction_counts(opens, closes):
+    """Count bullish (close > open) and bearish (close < open) candles"""
+    bullish = 0
+    bearish = 0
+    for i in range(len(closes)):
+        if closes[i] > opens[i]:
+            bullish += 1
+        elif closes[i] < opens[i]:
+            bearish += 1
+    return bullish, bearish
+
+
+def warm_kernels():
+    """Compile (or load cached) numba kernels before the first webhook needs them"""
+    if not NUMBA_AVAILABLE:
+        return
+    sample = kernel_array([1.0, 2.0, 3.0])
+    _structure_counts(sample, sample, sample, sample, 1.0)
+    _true_ranges(sample, sample, sample)
+    _direction_counts(sample, sample)
+
+
 # ============================================
 # TICKER CONFIGURATION
 # ============================================
@@ -192,8 +254,9 @@ class MTFAnalyzer:
         closes = [c.get('close', 0) for c in candles]
         
         # Count bullish vs bearish candles
-        bullish_count = sum(1 for c in candles if c.get('close', 0) > c.get('open', 0))
-        bearish_count = sum(1 for c in candles if c.get('close', 0) < c.get('open', 0))
+        bullish_count, bearish_count = _direction_counts(
+            kernel_array([c.get('open', 0) for c in candles]), kernel_array(closes)
+        )
         total = len(candles)
         
         # Check for higher highs / higher lows (bullish) or lower highs / lower lows (bearish)
@@ -314,21 +377,19 @@ class MTFAnalyzer:
         issues = []
         score = 100
         
+        opens = [c.get('open', 0) for c in candles]
         highs = [c.get('high', 0) for c in candles]
         lows = [c.get('low', 0) for c in candles]
+        closes = [c.get('close', 0) for c in candles]
         
         # Check for overlapping highs/lows (chop)
         avg_range = statistics.mean([h - l for h, l in zip(highs, lows)])
         
-        # Count overlapping candles
-        overlaps = 0
-        for i in range(1, len(candles)):
-            prev_low, prev_high = lows[i-1], highs[i-1]
-            curr_low, curr_high = lows[i], highs[i]
-            
-            overlap = min(prev_high, curr_high) - max(prev_low, curr_low)
-            if overlap > avg_range * 0.5:
-                overlaps += 1
+        # Count overlapping candles and wick-dominated candles in one kernel
+        overlaps, wick_dominated = _structure_counts(
+            kernel_array(opens), kernel_array(highs), kernel_array(lows),
+            kernel_array(closes), float(avg_range)
+        )
         
         overlap_ratio = overlaps / (len(candles) - 1) if len(candles) > 1 else 0
         
@@ -340,13 +401,6 @@ class MTFAnalyzer:
             issues.append('Moderate overlap')
         
         # Check for wick dominance
-        wick_dominated = 0
-        for c in candles:
-            body = abs(c.get('close', 0) - c.get('open', 0))
-            total_range = c.get('high', 0) - c.get('low', 0)
-            if total_range > 0 and body / total_range < 0.3:
-                wick_dominated += 1
-        
         wick_ratio = wick_dominated / len(candles)
         if wick_ratio > 0.5:
             score -= 20
@@ -792,18 +846,11 @@ class MTFAnalyzer:
         if not candles or len(candles) < 2:
             return 10
         
-        trs = []
-        for i in range(1, len(candles)):
-            high = candles[i].get('high', 0)
-            low = candles[i].get('low', 0)
-            prev_close = candles[i-1].get('close', 0)
-            
-            tr = max(
-                high - low,
-                abs(high - prev_close),
-                abs(low - prev_close)
-            )
-            trs.append(tr)
+        trs = _true_ranges(
+            kernel_array([c.get('high', 0) for c in candles]),
+            kernel_array([c.get('low', 0) for c in candles]),
+            kernel_array([c.get('close', 0) for c in candles])
+        )
         
         return statistics.mean(trs[-period:]) if trs else 10
     
@@ -14,6 +14,7 @@ Default buffer: 30 minutes before and after event
 """
 
 from datetime import datetime, time, timedelta
+import time as time_module
 import pytz
 
 EST = pytz.timezone('America/New_York')
@@ -22,6 +23,15 @@ EST = pytz.timezone('America/New_York')
 NEWS_BUFFER_BEFORE = 30  # Don't trade 30 min before
 NEWS_BUFFER_AFTER = 30   # Don't trade 30 min after
 
+# Blackout status is re-checked at most this often (seconds)
+BLACKOUT_CACHE_SECONDS = 10
+_blackout_cache = {"result": None, "checked_at": 0.0}
+
+# Upcoming-event lists are rebuilt at most this often (seconds)
+UPCOMING_CACHE_SECONDS = 60
+UPCOMING_CACHE_MAX_ENTRIES = 8    # days_ahead comes from a query string - keep it bounded
+_upcoming_cache = {}  # {days_ahead: (checked_at, events)}
+
 # ============================================
 # 2024-2025 HIGH IMPACT ECONOMIC CALENDAR
 # ============================================
@@ -96,10 +106,24 @@ def get_est_now():
 def check_news_blackout():
     """
     Check if we're currently in a news blackout period.
+    Result is memoized for BLACKOUT_CACHE_SECONDS.
     
     Returns:
         tuple: (is_blackout: bool, event_info: dict or None)
     """
+    now_mono = time_module.monotonic()
+    if (_blackout_cache["result"] is not None
+            and now_mono - _blackout_cache["checked_at"] < BLACKOUT_CACHE_SECONDS):
+        return _blackout_cache["result"]
+    
+    result = _scan_news_blackout()
+    _blackout_cache["result"] = result
+    _blackout_cache["checked_at"] = now_mono
+    return result
+
+
+def _scan_news_blackout():
+    """Scan the event calendar and daily danger times for an active blackout"""
     now = get_est_now()
     current_year = now.year
     
@@ -157,6 +181,7 @@ def check_news_blackout():
 def get_upcoming_events(days_ahead=7):
     """
     Get list of upcoming high-impact events.
+    Result is memoized per days_ahead for UPCOMING_CACHE_SECONDS.
     
     Args:
         days_ahead: Number of days to look ahead
@@ -164,6 +189,25 @@ def get_upcoming_events(days_ahead=7):
     Returns:
         list of event dicts
     """
+    now_mono = time_module.monotonic()
+    cached = _upcoming_cache.get(days_ahead)
+    if cached is not None and now_mono - cached[0] < UPCOMING_CACHE_SECONDS:
+        return cached[1]
+    
+    upcoming = _scan_upcoming_events(days_ahead)
+    if days_ahead not in _upcoming_cache and len(_upcoming_cache) >= UPCOMING_CACHE_MAX_ENTRIES:
+        # Drop expired entries, then the oldest if it's still full
+        for key in [k for k, (checked_at, _) in _upcoming_cache.items()
+                    if now_mono - checked_at >= UPCOMING_CACHE_SECONDS]:
+            del _upcoming_cache[key]
+        if len(_upcoming_cache) >= UPCOMING_CACHE_MAX_ENTRIES:
+            del _upcoming_cache[min(_upcoming_cache, key=lambda k: _upcoming_cache[k][0])]
+    _upcoming_cache[days_ahead] = (now_mono, upcoming)
+    return upcoming
+
+
+def _scan_upcoming_events(days_ahead):
+    """Build the upcoming event list from the schedule (uncached)"""
     now = get_est_now()
     current_year = now.year
     cutoff = now + timedelta(days=days_ahead)
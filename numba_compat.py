@@ -0,0 +1,30 @@
+"""
+Numba Compatibility
+Exports `njit` - numba's nopython JIT when numba is installed, otherwise a
+no-op decorator so the same kernels run as plain Python.
+
+Kernels are written as simple scalar loops. Use kernel_array() on their
+inputs: it hands numba contiguous float64 arrays, and leaves plain lists
+alone for the interpreter (indexing lists is faster than NumPy scalars).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def kernel_array(values):
+    """Prepare a numeric sequence for an njit kernel"""
+    if NUMBA_AVAILABLE:
+        return np.asarray(values, dtype=np.float64)
+    return values
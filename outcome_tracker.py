@@ -6,12 +6,13 @@ Integrates with Apex Trader Funding rules for P&L tracking
 Uses candle data from webhooks (preferred) or yfinance as fallback
 """
 
+import re
 import threading
 import time
 from datetime import datetime, timedelta
 
 # Import database functions
-from database import get_pending_signals, update_signal_outcome, load_candles
+from database import get_pending_signals, update_signal_outcome, update_signal_outcomes, load_candles
 
 # Import Apex rules for trade result tracking
 try:
@@ -35,14 +36,17 @@ def set_candle_storage(storage):
     candle_storage = storage
 
 
+# Contract month/year suffixes like Z2025, G2026
+CONTRACT_SUFFIX_RE = re.compile(r'[FGHJKMNQUVXZ]\d{4}$')
+
+
 def normalize_ticker(ticker):
     """Normalize ticker symbol - strip contract months like Z2025, G2026, etc."""
-    import re
     base = ticker.replace('=F', '').upper()
     if ':' in base:
         base = base.split(':')[-1]
     # Remove contract month/year suffixes like Z2025, G2026, H2025, etc.
-    base = re.sub(r'[FGHJKMNQUVXZ]\d{4}$', '', base)
+    base = CONTRACT_SUFFIX_RE.sub('', base)
     return base
 
 
@@ -76,9 +80,10 @@ def get_current_price(ticker):
     return None
 
 
-def check_signal_outcome(signal):
+def check_signal_outcome(signal, current_price=None):
     """
     Check if a signal has hit its target or stop
+    current_price: already-fetched price (looked up when not given)
     Returns: ('win', price, pnl) or ('loss', price, pnl) or (None, None, None)
     """
     ticker = signal['ticker']
@@ -90,7 +95,8 @@ def check_signal_outcome(signal):
     if not all([entry, stop, target]):
         return None, None, None
     
-    current_price = get_current_price(ticker)
+    if current_price is None:
+        current_price = get_current_price(ticker)
     if current_price is None:
         return None, None, None
     
@@ -228,22 +234,32 @@ def get_tracking_status():
     }
 
 
+def get_current_prices(tickers):
+    """Current price per ticker, looking each distinct ticker up once"""
+    prices = {}
+    for ticker in tickers:
+        if ticker not in prices:
+            prices[ticker] = get_current_price(ticker)
+    return prices
+
+
 def check_all_pending_outcomes():
     """
     Check ALL pending signals for outcomes - more reliable than threads.
+    Prices are fetched once per ticker and all outcomes written in one transaction.
     Returns list of updated signals.
     """
     pending = get_pending_signals()
+    prices = get_current_prices(signal['ticker'] for signal in pending)
     updated = []
     
     for signal in pending:
         try:
-            outcome, price, pnl = check_signal_outcome(signal)
+            outcome, price, pnl = check_signal_outcome(signal, prices[signal['ticker']])
             
             if outcome:
                 emoji = '✅' if outcome == 'WIN' else '❌'
                 print(f"{emoji} Signal #{signal['id']} {outcome}: {signal['ticker']} @ {price:.2f} (P&L: {pnl:+.2f})")
-                update_signal_outcome(signal['id'], outcome, price, pnl)
                 
                 updated.append({
                     'id': signal['id'],
@@ -252,20 +268,30 @@ def check_all_pending_outcomes():
                     'price': price,
                     'pnl': pnl
                 })
-                
-                # Update Apex rules tracking
-                if APEX_ENABLED:
-                    try:
-                        apex_result = record_trade_result(signal['ticker'], pnl)
-                        if apex_result.get('alerts'):
-                            for alert in apex_result['alerts']:
-                                print(f"🚨 APEX ALERT: {alert['title']}")
-                    except Exception as e:
-                        print(f"⚠️  Error updating Apex tracking: {e}")
         
         except Exception as e:
             print(f"⚠️  Error checking signal #{signal.get('id')}: {e}")
     
+    if not updated:
+        return updated
+    
+    try:
+        update_signal_outcomes([(u['id'], u['outcome'], u['price'], u['pnl']) for u in updated])
+    except Exception as e:
+        print(f"⚠️  Error saving {len(updated)} outcomes: {e}")
+        return []
+    
+    # Update Apex rules tracking
+    if APEX_ENABLED:
+        for u in updated:
+            try:
+                apex_result = record_trade_result(u['ticker'], u['pnl'])
+                if apex_result.get('alerts'):
+                    for alert in apex_result['alerts']:
+                        print(f"🚨 APEX ALERT: {alert['title']}")
+            except Exception as e:
+                print(f"⚠️  Error updating Apex tracking: {e}")
+    
     return updated
 
 
@@ -10,8 +10,9 @@ import re
 from datetime import datetime
 from collections import defaultdict
 
+from settings_store import SETTINGS_FILE, write_settings
+
 # File paths
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
 PROMPT_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompt_history.json')
 
 # Base system prompt template with placeholders for modifications
@@ -185,8 +186,7 @@ def add_emphasis(phrase, reason=""):
         save_prompt_history(history)
         
         # Save settings
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return True
     return False
@@ -215,8 +215,7 @@ def add_caution(phrase, reason=""):
         save_prompt_history(history)
         
         # Save settings
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return True
     return False
@@ -233,8 +232,7 @@ def remove_emphasis(phrase):
         emphasize.remove(phrase)
         settings['prompt_modifications']['emphasize'] = emphasize
         
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return True
     return False
@@ -251,8 +249,7 @@ def remove_caution(phrase):
         caution.remove(phrase)
         settings['prompt_modifications']['caution'] = caution
         
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return True
     return False
@@ -287,8 +284,7 @@ def reset_prompt():
     if 'direction_preference' in settings:
         del settings['direction_preference']
     
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=2)
+    write_settings(settings)
     
     # Log reset
     history = load_prompt_history()
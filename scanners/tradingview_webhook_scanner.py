@@ -8,17 +8,28 @@ Port: 5055
 import json
 import datetime as dt
 import os
+import re
 import sys
+import logging
 import requests as http_requests
-from flask import Flask, request, jsonify, render_template
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request, jsonify, render_template
+from markupsafe import Markup
 from openai import OpenAI
 import smtplib
 from email.mime.text import MIMEText
-from collections import deque
+from collections import deque, OrderedDict, defaultdict
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import webbrowser
+import atexit
 import threading
 import time
 
+log = logging.getLogger(__name__)
+
 # EST timezone helper using pytz for proper timezone handling
 import pytz
 EST = pytz.timezone('America/New_York')
@@ -27,9 +38,30 @@ def est_now():
     """Get current time in EST"""
     return dt.datetime.now(EST)
 
+# Last formatted EST string per format: {fmt: (epoch second, text)}
+_est_str_cache = {}
+
 def est_time_str(fmt="%H:%M:%S"):
-    """Get EST time as formatted string"""
-    return est_now().strftime(fmt)
+    """Get EST time as formatted string (reformatted at most once per second)"""
+    second = int(time.time())
+    cached = _est_str_cache.get(fmt)
+    if cached is not None and cached[0] == second:
+        return cached[1]
+    text = est_now().strftime(fmt)
+    _est_str_cache[fmt] = (second, text)
+    return text
+
+@lru_cache(maxsize=1024)
+def _iso_to_est(timestamp_str):
+    """ISO timestamp -> EST string (cached - every ticker's bar shares the same close time)"""
+    # ISO format: 2025-12-05T17:18:00Z or 2025-12-05T17:18:00+00:00
+    ts = timestamp_str.replace('Z', '+00:00')
+    parsed = dt.datetime.fromisoformat(ts)
+    if parsed.tzinfo is None:
+        # Assume UTC if no timezone
+        parsed = pytz.UTC.localize(parsed)
+    est_time = parsed.astimezone(EST)
+    return est_time.strftime("%Y-%m-%d %H:%M:%S")
 
 def convert_to_est(timestamp_str):
     """
@@ -43,14 +75,7 @@ def convert_to_est(timestamp_str):
     try:
         # Try parsing ISO format with timezone
         if 'T' in str(timestamp_str):
-            # ISO format: 2025-12-05T17:18:00Z or 2025-12-05T17:18:00+00:00
-            ts = str(timestamp_str).replace('Z', '+00:00')
-            parsed = dt.datetime.fromisoformat(ts)
-            if parsed.tzinfo is None:
-                # Assume UTC if no timezone
-                parsed = pytz.UTC.localize(parsed)
-            est_time = parsed.astimezone(EST)
-            return est_time.strftime("%Y-%m-%d %H:%M:%S")
+            return _iso_to_est(str(timestamp_str))
         
         # Try parsing just time (HH:MM:SS) - assume it's from today
         if len(str(timestamp_str)) <= 8 and ':' in str(timestamp_str):
@@ -76,6 +101,22 @@ except ImportError:
     NGROK_AVAILABLE = False
     print("⚠️  pyngrok not installed - run: pip install pyngrok")
 
+# Fast JSON encoding for hot dashboard endpoints
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Multi-threaded production WSGI server (single process, so in-memory candle
+# storage is still shared by every request)
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import (
@@ -85,12 +126,13 @@ from database import (
     load_all_candles, get_candle_counts, clear_old_candles
 )
 from outcome_tracker import set_candle_storage, check_all_pending_outcomes
+from candle_ring import CandleRing, OPEN, HIGH, LOW, CLOSE, VOLUME
 from apex_rules import (
     get_apex_status, update_apex_config, reset_apex_state,
     record_trade_result, should_block_trading, check_all_rules
 )
 from analytics import (
-    get_full_analytics, get_win_rate_chart_data, get_pnl_chart_data,
+    ANALYTICS_SECTIONS, get_full_analytics, get_win_rate_chart_data, get_pnl_chart_data,
     get_ticker_performance, get_hourly_distribution, get_confidence_performance
 )
 from ai_tuning import (
@@ -99,6 +141,7 @@ from ai_tuning import (
 from market_levels import get_market_levels, MarketLevels
 from news_filter import check_news_blackout, get_news_status, get_upcoming_events
 from strategy_coach import run_analysis as run_coach_analysis, get_insights as get_coach_insights
+from settings_store import SETTINGS_FILE, write_settings
 from suggestion_manager import (
     add_suggestions, get_pending_suggestions, approve_suggestion,
     reject_suggestion, get_history as get_suggestion_history,
@@ -106,7 +149,7 @@ from suggestion_manager import (
 )
 from prompt_evolver import get_current_prompt, get_prompt_status, reset_prompt
 from market_regime import get_current_regime, get_regime_suggestions, get_regime_trading_guidance
-from mtf_analyzer import analyze_ticker as mtf_analyze, MTFAnalyzer
+from mtf_analyzer import analyze_ticker as mtf_analyze, MTFAnalyzer, warm_kernels
 from data_fetcher import fetch_backup_data, merge_candles, data_fetcher
 
 # Import time tiers for v3.0
@@ -148,10 +191,19 @@ SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 EMAIL_USER = os.environ.get("EMAIL_USER", "")
 EMAIL_PASS = os.environ.get("EMAIL_PASS", "")
+SMTP_KEEPALIVE_SECONDS = 60  # NOOP interval to keep the pooled SMTP session open
 # ================================
 
 # ========= DISCORD CONFIG =========
 DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
+
+# Shared keep-alive session so alert bursts reuse the TLS connection
+http_session = http_requests.Session()
+http_session.headers.update({'Connection': 'keep-alive'})
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
 # ==================================
 
 
@@ -233,32 +285,26 @@ def send_discord_alert(ticker, signal, analysis_details=None):
         title = f"{tier_emoji} {tier_name} SIGNAL - {ticker}"
         
         # Build TRADE SETUP section
-        trade_setup = f"**Direction:** {direction}\n"
-        trade_setup += f"**Confidence Level:** {confidence}%"
+        trade_setup = f"**Direction:** {direction}\n**Confidence Level:** {confidence}%"
         
         # Build Entry Strategy section with stop info
-        entry_strategy = f"• **Entry Price:** {entry:.2f}\n"
         stop_note = " (capped at max)" if stop_capped else ""
-        entry_strategy += f"• **Stop Loss:** {stop:.2f} ({stop_pips:.1f} pts away){stop_note}"
+        entry_strategy = (f"• **Entry Price:** {entry:.2f}\n"
+                          f"• **Stop Loss:** {stop:.2f} ({stop_pips:.1f} pts away){stop_note}")
         
         # Build Profit Targets section with tier-based R:R
-        profit_targets = ""
-        if target1:
-            profit_targets += f"• **Target 1:** {target1:.2f} ({target1_pips:.1f} pts, 1:{target1_rr:.1f} R:R)\n"
         if target2:
-            profit_targets += f"• **Target 2:** {target2:.2f} ({target2_pips:.1f} pts, 1:{target2_rr:.1f} R:R)"
+            target_lines = []
+            if target1:
+                target_lines.append(f"• **Target 1:** {target1:.2f} ({target1_pips:.1f} pts, 1:{target1_rr:.1f} R:R)")
+            target_lines.append(f"• **Target 2:** {target2:.2f} ({target2_pips:.1f} pts, 1:{target2_rr:.1f} R:R)")
+            profit_targets = "\n".join(target_lines)
         else:
             profit_targets = f"• **Target:** {target:.2f}"
         
         # Build MTF Analysis section
-        mtf_text = ""
         if mtf_analysis:
-            if mtf_analysis.get('15m'):
-                mtf_text += f"**15m:** {mtf_analysis['15m']}\n"
-            if mtf_analysis.get('5m'):
-                mtf_text += f"**5m:** {mtf_analysis['5m']}\n"
-            if mtf_analysis.get('1m'):
-                mtf_text += f"**1m:** {mtf_analysis['1m']}"
+            mtf_text = "\n".join(f"**{tf}:** {mtf_analysis[tf]}" for tf in ('15m', '5m', '1m') if mtf_analysis.get(tf))
         else:
             mtf_text = "All timeframes aligned"
         
@@ -270,17 +316,21 @@ def send_discord_alert(ticker, signal, analysis_details=None):
         contracts = position.get('contracts', 1)
         actual_risk = position.get('actual_risk', tier_risk)
         
-        position_text = f"**Suggested Risk:** ${tier_risk}\n"
-        position_text += f"**Position:** {contracts} contract(s) @ ${actual_risk:.0f} risk\n"
+        position_lines = [
+            f"**Suggested Risk:** ${tier_risk}",
+            f"**Position:** {contracts} contract(s) @ ${actual_risk:.0f} risk"
+        ]
         if potential_profit_t1 > 0:
-            position_text += f"**Potential Profit T1:** ${potential_profit_t1:.0f}"
+            position_lines.append(f"**Potential Profit T1:** ${potential_profit_t1:.0f}")
+        position_text = "\n".join(position_lines)
         
         # Signal time and session info
         now_est = est_now()
         signal_time = now_est.strftime('%I:%M %p ET')
-        time_info = f"⏰ **Signal Time:** {signal_time}\n"
+        time_lines = [f"⏰ **Signal Time:** {signal_time}"]
         if session_window:
-            time_info += f"🕐 **Session:** {tier_name} ({session_window})"
+            time_lines.append(f"🕐 **Session:** {tier_name} ({session_window})")
+        time_info = "\n".join(time_lines)
         
         # Build Discord embed
         embed = {
@@ -316,7 +366,7 @@ def send_discord_alert(ticker, signal, analysis_details=None):
             "embeds": [embed]
         }
         
-        response = http_requests.post(DISCORD_WEBHOOK_URL, json=payload, timeout=10)
+        response = http_session.post(DISCORD_WEBHOOK_URL, data=json_bytes(payload), headers=JSON_HEADERS, timeout=10)
         
         if response.status_code in [200, 204]:
             print(f"📱 Discord alert sent for {ticker} ({tier_name})")
@@ -346,12 +396,12 @@ def get_dynamic_min_confidence():
     return MIN_CONFIDENCE
 # ==========================================
 
-# Track last analysis time per ticker
+# Track last analysis time per ticker (time.monotonic() seconds)
 last_analysis_time = {}
 
 # ========= SMART ALERT COOLDOWN =========
 # Only send alerts when something ACTUALLY changes, not every 5 minutes
-last_alert_info = {}  # {ticker: {'direction': 'LONG', 'entry': 25800, 'confidence': 92, 'time': datetime}}
+last_alert_info = {}  # {ticker: {'direction': 'LONG', 'entry': 25800, 'confidence': 92, 'time': monotonic seconds}}
 
 # Thresholds for new alert (per ticker type)
 ALERT_PRICE_THRESHOLD = {
@@ -373,9 +423,7 @@ def should_send_alert(ticker, direction, entry, confidence):
     
     Returns: (should_send: bool, reason: str)
     """
-    import re
-    # Normalize ticker
-    base_ticker = re.sub(r'[FGHJKMNQUVXZ]\d{4}$', '', ticker).replace('=F', '').upper()
+    base_ticker = normalize_ticker(ticker)
     
     last = last_alert_info.get(base_ticker)
     
@@ -403,8 +451,8 @@ def should_send_alert(ticker, direction, entry, confidence):
         return True, f"Confidence increased +{conf_diff}% (was {last_conf}%)"
     
     # 4. Minimum cooldown passed
-    if last_time:
-        minutes_since = (dt.datetime.now() - last_time).total_seconds() / 60
+    if last_time is not None:
+        minutes_since = (time.monotonic() - last_time) / 60
         if minutes_since >= ALERT_MIN_COOLDOWN_MINUTES:
             return True, f"Cooldown passed ({minutes_since:.0f} min since last)"
     
@@ -413,13 +461,12 @@ def should_send_alert(ticker, direction, entry, confidence):
 
 def record_alert_sent(ticker, direction, entry, confidence):
     """Record that we sent an alert for this ticker"""
-    import re
-    base_ticker = re.sub(r'[FGHJKMNQUVXZ]\d{4}$', '', ticker).replace('=F', '').upper()
+    base_ticker = normalize_ticker(ticker)
     last_alert_info[base_ticker] = {
         'direction': direction,
         'entry': entry,
         'confidence': confidence,
-        'time': dt.datetime.now()
+        'time': time.monotonic()
     }
     print(f"📝 Recorded alert: {base_ticker} {direction} @ {entry} ({confidence}%)")
 
@@ -444,7 +491,7 @@ MAX_TICKS = {
 # 5m: 100 candles = 8+ hours (full trading day)
 # 15m: 60 candles = 15 hours (day + overnight)
 candle_storage = {
-    "1m": {},   # ticker -> deque of candles
+    "1m": {},   # ticker -> CandleRing of candles
     "5m": {},
     "15m": {}
 }
@@ -456,6 +503,10 @@ CANDLE_LIMITS = {
     "15m": 60
 }
 
+# Per-ticker lock guarding that ticker's 1m/5m/15m rings - writers append
+# and aggregate under it, readers hold it only long enough to copy out
+candle_locks = defaultdict(threading.Lock)
+
 # File for persisting candle history
 CANDLE_HISTORY_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'candle_history.json')
 
@@ -476,11 +527,14 @@ def save_candle_history():
     except Exception as e:
         print(f"⚠️  Error saving candle history: {e}")
 
+# Contract month/year suffixes like Z2025, G2026, H2025, etc.
+CONTRACT_SUFFIX_RE = re.compile(r'[FGHJKMNQUVXZ]\d{4}$')
+
+@lru_cache(maxsize=256)
 def normalize_ticker(ticker):
     """Normalize ticker symbol - strip contract months like Z2025, G2026, etc."""
-    import re
-    # Remove contract month/year suffixes like Z2025, G2026, H2025, etc.
-    base = re.sub(r'[FGHJKMNQUVXZ]\d{4}$', '', ticker)
+    # Remove contract month/year suffixes (webhook tickers repeat, so results are cached)
+    base = CONTRACT_SUFFIX_RE.sub('', ticker)
     # Also remove =F suffix
     base = base.replace('=F', '')
     return base.upper()
@@ -513,9 +567,9 @@ def load_candle_history():
                     if base_ticker in candle_storage[tf]:
                         existing = list(candle_storage[tf][base_ticker])
                         combined = existing + candles
-                        candle_storage[tf][base_ticker] = deque(combined[-maxlen:], maxlen=maxlen)
+                        candle_storage[tf][base_ticker] = CandleRing(maxlen, combined[-maxlen:])
                     else:
-                        candle_storage[tf][base_ticker] = deque(candles, maxlen=maxlen)
+                        candle_storage[tf][base_ticker] = CandleRing(maxlen, candles[-maxlen:])
                     
                     total_loaded += len(candles)
         
@@ -540,9 +594,9 @@ def load_candle_history():
 
 # Initialize storage for each ticker with new limits
 for ticker in ["MNQ", "MES", "MGC"]:
-    candle_storage["1m"][ticker] = deque(maxlen=CANDLE_LIMITS["1m"])  # 300 candles
-    candle_storage["5m"][ticker] = deque(maxlen=CANDLE_LIMITS["5m"])  # 100 candles
-    candle_storage["15m"][ticker] = deque(maxlen=CANDLE_LIMITS["15m"])  # 60 candles
+    candle_storage["1m"][ticker] = CandleRing(CANDLE_LIMITS["1m"])  # 300 candles
+    candle_storage["5m"][ticker] = CandleRing(CANDLE_LIMITS["5m"])  # 100 candles
+    candle_storage["15m"][ticker] = CandleRing(CANDLE_LIMITS["15m"])  # 60 candles
 
 # Load history from previous session
 load_candle_history()
@@ -620,6 +674,24 @@ static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file
 app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
 
 
+def json_response(payload):
+    """JSON response encoded with orjson when installed, else Flask's jsonify"""
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(payload, option=ORJSON_OPTIONS)
+        return Response(body, mimetype='application/json')
+    return jsonify(payload)
+
+
+# Headers for posting pre-encoded JSON bodies
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def json_bytes(payload):
+    """Encode payload to JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
 def get_tick_size(ticker):
     """Get tick size for ticker"""
     base_ticker = ticker.split(":")[0] if ":" in ticker else ticker
@@ -638,64 +710,103 @@ def store_candle(ticker, timeframe, candle_data):
     base_ticker = ticker.split(":")[0] if ":" in ticker else ticker
     base_ticker = normalize_ticker(base_ticker)
     
-    # Ensure ticker exists in storage
-    if base_ticker not in candle_storage[timeframe]:
-        candle_storage[timeframe][base_ticker] = deque(maxlen=CANDLE_LIMITS[timeframe])
+    with candle_locks[base_ticker]:
+        # Ensure ticker exists in storage
+        ring = candle_storage[timeframe].get(base_ticker)
+        if ring is None:
+            ring = candle_storage[timeframe][base_ticker] = CandleRing(CANDLE_LIMITS[timeframe])
+        
+        ring.append(candle_data)
+        total = len(ring)
+        
+        # Auto-aggregate 1m candles into 5m and 15m
+        if timeframe == "1m":
+            aggregate_candles(base_ticker)
     
-    candle_storage[timeframe][base_ticker].append(candle_data)
-    print(f"  📊 Stored {timeframe} candle for {base_ticker} (total: {len(candle_storage[timeframe][base_ticker])})")
+    print(f"  📊 Stored {timeframe} candle for {base_ticker} (total: {total})")
     
     # Save to database for persistence
     db_save_candle(base_ticker, timeframe, candle_data)
     
-    # Auto-aggregate 1m candles into 5m and 15m
-    if timeframe == "1m":
-        aggregate_candles(base_ticker)
-        
-        # Auto-save JSON backup every 5 candles (5 minutes) - keeping as backup
-        if len(candle_storage["1m"][base_ticker]) % 5 == 0:
-            save_candle_history()
+    # Auto-save JSON backup every 5 candles (5 minutes) - keeping as backup
+    if timeframe == "1m" and total % 5 == 0:
+        save_candle_history()
+
+
+# 1m candles received since the last completed 5m/15m bucket, per ticker
+AGGREGATE_PERIODS = (("5m", 5), ("15m", 15))
+aggregate_pending = {"5m": {}, "15m": {}}
 
 
 def aggregate_candles(ticker):
     """
     Aggregate 1m candles into 5m and 15m candles
-    Called automatically after each 1m candle is stored
+    Called automatically after each 1m candle is stored - only the bucket
+    that just completed is reduced, nothing is re-aggregated
     """
-    candles_1m = list(candle_storage["1m"].get(ticker, []))
-    
-    if len(candles_1m) < 5:
-        return  # Not enough data yet
-    
-    # Build 5m candles (every 5 x 1m candles)
-    build_aggregated_candles(ticker, candles_1m, 5, "5m")
+    ring_1m = candle_storage["1m"].get(ticker)
+    if ring_1m is None:
+        return
+    n = len(ring_1m)
     
-    # Build 15m candles (every 15 x 1m candles)  
-    build_aggregated_candles(ticker, candles_1m, 15, "15m")
+    for target_tf, period in AGGREGATE_PERIODS:
+        pending = aggregate_pending[target_tf].get(ticker)
+        
+        # First candle since startup (or the 1m ring was cleared) -
+        # line the buckets up with the 1m window once
+        if pending is None or n < period:
+            build_aggregated_candles(ticker, ring_1m.time_list(), ring_1m.view(), period, target_tf)
+            aggregate_pending[target_tf][ticker] = n % period
+            continue
+        
+        pending += 1
+        if pending == period:
+            append_aggregated_candle(ticker, ring_1m, period, target_tf)
+            pending = 0
+        aggregate_pending[target_tf][ticker] = pending
+
+
+def append_aggregated_candle(ticker, ring_1m, period, target_tf):
+    """Reduce the last `period` 1m candles into one 5m/15m candle"""
+    ring = candle_storage[target_tf].get(ticker)
+    if ring is None:
+        ring = candle_storage[target_tf][ticker] = CandleRing(CANDLE_LIMITS[target_tf])
+    
+    times, rows = ring_1m.tail(period)
+    ring.append_values(
+        times[0],                   # Time of first candle
+        rows[0, OPEN],              # Open of first candle
+        rows[:, HIGH].max(),        # Highest high
+        rows[:, LOW].min(),         # Lowest low
+        rows[-1, CLOSE],            # Close of last candle
+        rows[:, VOLUME].sum()       # Sum of volume
+    )
 
 
-def build_aggregated_candles(ticker, candles_1m, period, target_tf):
+def build_aggregated_candles(ticker, times_1m, ohlcv_1m, period, target_tf):
     """
     Build aggregated candles from 1m data
     
     Args:
         ticker: Symbol
-        candles_1m: List of 1m candles
+        times_1m: List of 1m candle times (oldest first)
+        ohlcv_1m: (N, 5) array of 1m OHLCV rows matching times_1m
         period: Number of 1m candles per aggregated candle (5 or 15)
         target_tf: Target timeframe ('5m' or '15m')
     """
-    # Ensure storage exists
-    if ticker not in candle_storage[target_tf]:
-        candle_storage[target_tf][ticker] = deque(maxlen=CANDLE_LIMITS[target_tf])
+    # Ensure storage exists - bound once for the whole build
+    ring = candle_storage[target_tf].get(ticker)
+    if ring is None:
+        ring = candle_storage[target_tf][ticker] = CandleRing(CANDLE_LIMITS[target_tf])
     
     # Calculate how many complete periods we can build
-    num_complete = len(candles_1m) // period
+    num_complete = len(times_1m) // period
     
     if num_complete == 0:
         return
     
     # Current count of aggregated candles
-    current_count = len(candle_storage[target_tf][ticker])
+    current_count = len(ring)
     
     # Only build if we have new complete periods
     # (avoid rebuilding the same candles)
@@ -704,28 +815,32 @@ def build_aggregated_candles(ticker, candles_1m, period, target_tf):
     if current_count >= expected_count:
         return  # Already up to date
     
-    # Clear and rebuild (simpler than incremental updates)
-    candle_storage[target_tf][ticker].clear()
-    
-    for i in range(num_complete):
-        start_idx = i * period
-        end_idx = start_idx + period
-        chunk = candles_1m[start_idx:end_idx]
-        
-        if len(chunk) == period:
-            aggregated = {
-                'time': chunk[0].get('time', ''),  # Time of first candle
-                'open': chunk[0].get('open', 0),   # Open of first candle
-                'high': max(c.get('high', 0) for c in chunk),  # Highest high
-                'low': min(c.get('low', float('inf')) for c in chunk),  # Lowest low
-                'close': chunk[-1].get('close', 0),  # Close of last candle
-                'volume': sum(c.get('volume', 0) for c in chunk)  # Sum of volume
-            }
-            candle_storage[target_tf][ticker].append(aggregated)
+    # Append just the new periods when the stored candles line up with the
+    # 1m window, otherwise (e.g. aggregates loaded from the DB) rebuild
+    if current_count and ring.last_time() == times_1m[(current_count - 1) * period]:
+        first = current_count
+    else:
+        ring.clear()
+        first = 0
+    
+    # Reduce every new period at once: (num_complete - first, period, 5)
+    blocks = ohlcv_1m[first * period:num_complete * period].reshape(-1, period, 5)
+    opens = blocks[:, 0, OPEN].tolist()  # Open of first candle
+    highs = blocks[:, :, HIGH].max(axis=1).tolist()  # Highest high
+    lows = blocks[:, :, LOW].min(axis=1).tolist()  # Lowest low
+    closes = blocks[:, -1, CLOSE].tolist()  # Close of last candle
+    volumes = blocks[:, :, VOLUME].sum(axis=1).tolist()  # Sum of volume
+    
+    append_values = ring.append_values
+    for k in range(num_complete - first):
+        append_values(
+            times_1m[(first + k) * period],  # Time of first candle
+            opens[k], highs[k], lows[k], closes[k], volumes[k]
+        )
     
-    new_count = len(candle_storage[target_tf][ticker])
+    new_count = len(ring)
     if new_count > current_count:
-        print(f"  📈 Auto-built {new_count} x {target_tf} candles for {ticker} (from {len(candles_1m)} x 1m)")
+        print(f"  📈 Auto-built {new_count} x {target_tf} candles for {ticker} (from {len(times_1m)} x 1m)")
 
 
 def format_data_for_ai(ticker):
@@ -734,48 +849,43 @@ def format_data_for_ai(ticker):
     tick_size = get_tick_size(base_ticker)
     max_ticks = get_max_ticks(base_ticker)
     
-    output = f"TICKER: {base_ticker}\n"
-    output += f"TICK_SIZE: {tick_size}\n"
-    output += f"MAX_STOP_TICKS: {max_ticks}\n\n"
+    parts = [
+        f"TICKER: {base_ticker}\n",
+        f"TICK_SIZE: {tick_size}\n",
+        f"MAX_STOP_TICKS: {max_ticks}\n\n"
+    ]
     
     for timeframe in ["15m", "5m", "1m"]:
-        candles = candle_storage[timeframe].get(base_ticker, [])
+        candles = candle_storage[timeframe].get(base_ticker)
         
         if not candles:
-            output += f"=== {timeframe.upper()} DATA ===\nNo data available yet\n\n"
+            parts.append(f"=== {timeframe.upper()} DATA ===\nNo data available yet\n\n")
             continue
         
-        output += f"=== {timeframe.upper()} DATA (last {min(10, len(candles))} candles) ===\n"
+        parts.append(f"=== {timeframe.upper()} DATA (last {min(10, len(candles))} candles) ===\n")
         
-        # Get last 10 candles
-        recent = list(candles)[-10:]
+        # Get last 10 candles straight from the OHLCV columns
+        times, rows = candles.tail(10)
         
-        for candle in recent:
-            timestamp = candle.get('time', 'unknown')
-            o = candle.get('open', 0)
-            h = candle.get('high', 0)
-            l = candle.get('low', 0)
-            c = candle.get('close', 0)
-            v = candle.get('volume', 0)
-            
-            output += f"{timestamp} | O:{o:.2f} H:{h:.2f} L:{l:.2f} C:{c:.2f} V:{int(v)}\n"
+        for t, (o, h, l, c, v) in zip(times, rows.tolist()):
+            parts.append(f"{t} | O:{o:.2f} H:{h:.2f} L:{l:.2f} C:{c:.2f} V:{int(v)}\n")
         
-        output += "\n"
+        parts.append("\n")
     
-    return output
+    return "".join(parts)
 
 
 def check_momentum_alignment(ticker, direction):
     """Check if recent 1m candles support the trade direction"""
     base_ticker = ticker.split(":")[0] if ":" in ticker else ticker
-    candles = candle_storage["1m"].get(base_ticker, [])
+    candles = candle_storage["1m"].get(base_ticker)
     
-    if len(candles) < 3:
+    if candles is None or len(candles) < 3:
         return False, "insufficient_data"
     
-    recent = list(candles)[-3:]
-    bullish_count = sum(1 for c in recent if c.get('close', 0) > c.get('open', 0))
-    bearish_count = sum(1 for c in recent if c.get('close', 0) < c.get('open', 0))
+    _, recent = candles.tail(3)
+    bullish_count = int((recent[:, CLOSE] > recent[:, OPEN]).sum())
+    bearish_count = int((recent[:, CLOSE] < recent[:, OPEN]).sum())
     
     if direction == "long":
         if bearish_count == 3:
@@ -794,11 +904,21 @@ def check_momentum_alignment(ticker, direction):
 def calculate_risk_reward(entry, stop, target):
     """Calculate R:R ratio"""
     try:
-        risk = abs(float(entry) - float(stop))
-        reward = abs(float(target) - float(entry))
-        return reward / risk if risk > 0 else 0
-    except (ValueError, TypeError, ZeroDivisionError):
-        return 0
+        # Fast path: AI JSON already gives us numbers
+        risk = entry - stop
+        reward = target - entry
+    except TypeError:
+        # Strings (or None) - convert, treating anything unparseable as 0 R:R
+        try:
+            risk = float(entry) - float(stop)
+            reward = float(target) - float(entry)
+        except (ValueError, TypeError):
+            return 0
+    if risk < 0:
+        risk = -risk
+    if reward < 0:
+        reward = -reward
+    return reward / risk if risk > 0 else 0
 
 
 def validate_signal(signal, ticker):
@@ -807,12 +927,12 @@ def validate_signal(signal, ticker):
     
     ALL criteria must be met:
     1. Not in overnight blocked period (9 PM - 6 AM)
-    2. No active news blackout
-    3. Confidence >= tier threshold (80% PRIME, 85% MIDDAY, 90% EXTENDED)
-    4. Valid direction (3/3 MTF alignment)
-    5. Required price levels
-    6. R:R >= 1.0 (tier-based targets)
-    7. Price drift acceptable
+    2. Confidence >= tier threshold (80% PRIME, 85% MIDDAY, 90% EXTENDED)
+    3. Valid direction (3/3 MTF alignment)
+    4. Required price levels
+    5. R:R >= 1.0 (tier-based targets)
+    6. Price drift acceptable
+    7. No active news blackout
     8. ORB bias alignment (LONG/SHORT must match daily bias)
     9. PDH/PDL safety (not too close to major levels)
     """
@@ -838,53 +958,58 @@ def validate_signal(signal, ticker):
         tier_name = "DEFAULT"
         min_conf = MIN_CONFIDENCE
     
-    # Check 1: News blackout
-    is_blackout, news_event = check_news_blackout()
-    if is_blackout:
-        reasons.append(f"🚫 NEWS BLACKOUT: {news_event['event']} - Clear in {news_event['minutes_until_clear']} min")
-        return False, reasons
+    # Cheap arithmetic-only checks run first so failing signals never pay
+    # for the news calendar scan or market level lookups below
     
-    # Get market levels for bias and level checks
-    market_lvls = get_market_levels()
-    
-    # Check 2: Confidence (tier-based threshold)
+    # Check 1: Confidence (tier-based threshold)
     if confidence < min_conf:
         reasons.append(f"❌ Confidence {confidence}% below {tier_name} threshold {min_conf}%")
         return False, reasons
     
-    # Check 3: Direction (must be valid LONG/SHORT from 3/3 alignment)
+    # Check 2: Direction (must be valid LONG/SHORT from 3/3 alignment)
     if direction == "no_trade" or direction == "STAY_AWAY":
         reasons.append("⚠️  No trade signal (MTF not aligned)")
         return False, reasons
     
-    # Check 4: Required fields
+    # Check 3: Required fields
     if entry is None or stop is None or target is None or current_price is None:
         reasons.append("❌ Missing required price levels")
         return False, reasons
     
-    # Check 5: R:R (1.0 minimum since targets are tier-based)
+    # Check 4: R:R (1.0 minimum since targets are tier-based)
     rr = calculate_risk_reward(entry, stop, target)
+    rr_text = "%.2f" % rr
     if rr < MIN_RISK_REWARD:
-        reasons.append(f"❌ R:R {rr:.2f} below minimum {MIN_RISK_REWARD}")
+        reasons.append(f"❌ R:R {rr_text} below minimum {MIN_RISK_REWARD}")
         return False, reasons
     
-    # Check 6: Price drift
+    # Check 5: Price drift
     tick_size = get_tick_size(ticker)
     drift = abs(float(current_price) - float(entry))
     drift_ticks = drift / tick_size
+    drift_text = "%.1f" % drift_ticks
     
     if drift_ticks > MAX_PRICE_DRIFT_TICKS:
-        reasons.append(f"❌ Price drifted {drift_ticks:.1f} ticks from entry")
+        reasons.append(f"❌ Price drifted {drift_text} ticks from entry")
         return False, reasons
     
-    # Check 6: ORB Bias Alignment (NEW in v2.0)
+    # Check 6: News blackout
+    is_blackout, news_event = check_news_blackout()
+    if is_blackout:
+        reasons.append(f"🚫 NEWS BLACKOUT: {news_event['event']} - Clear in {news_event['minutes_until_clear']} min")
+        return False, reasons
+    
+    # Get market levels for bias and level checks
+    market_lvls = get_market_levels()
+    
+    # Check 7: ORB Bias Alignment (NEW in v2.0)
     bias_aligned, bias_reason = market_lvls.check_bias_alignment(ticker, direction, current_price)
     if not bias_aligned:
         reasons.append(f"❌ {bias_reason}")
         return False, reasons
     reasons.append(f"✓ {bias_reason}")
     
-    # Check 7: PDH/PDL Safety (NEW in v2.0)
+    # Check 8: PDH/PDL Safety (NEW in v2.0)
     level_safe, level_reason = market_lvls.check_entry_safety(ticker, entry, direction)
     if not level_safe:
         reasons.append(f"❌ {level_reason}")
@@ -892,10 +1017,12 @@ def validate_signal(signal, ticker):
     reasons.append(f"✓ {level_reason}")
     
     # All checks passed
-    reasons.append("✓ MTF alignment confirmed")
-    reasons.append(f"✓ Confidence: {confidence}%")
-    reasons.append(f"✓ R:R: {rr:.2f}")
-    reasons.append(f"✓ Price drift: {drift_ticks:.1f} ticks")
+    reasons.extend((
+        "✓ MTF alignment confirmed",
+        f"✓ Confidence: {confidence}%",
+        f"✓ R:R: {rr_text}",
+        f"✓ Price drift: {drift_text} ticks"
+    ))
     
     return True, reasons
 
@@ -919,6 +1046,68 @@ def analyze_with_ai(data_text):
         return None
 
 
+# ========= SMTP CONNECTION =========
+# One authenticated SMTP session shared by all alerts - saves the TCP + STARTTLS
+# + login round trips on every email. Reopened lazily when the server drops it.
+_smtp_conn = None
+_smtp_lock = threading.Lock()
+_smtp_keepalive_started = False
+
+# Discord/email alerts are sent off the request thread so webhooks don't
+# wait on HTTPS or SMTP round trips
+alert_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="alert")
+
+
+def _close_smtp_connection():
+    """Drop the pooled SMTP connection (caller holds _smtp_lock)"""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.close()
+        except Exception:
+            pass
+    _smtp_conn = None
+
+
+def _get_smtp_connection():
+    """Get the pooled SMTP connection, opening it if needed (caller holds _smtp_lock)"""
+    global _smtp_conn, _smtp_keepalive_started
+    if _smtp_conn is None:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=30)
+        server.starttls()
+        server.login(EMAIL_USER, EMAIL_PASS)
+        _smtp_conn = server
+        
+        if not _smtp_keepalive_started:
+            _smtp_keepalive_started = True
+            threading.Thread(target=_smtp_keepalive_loop, daemon=True).start()
+    return _smtp_conn
+
+
+def _smtp_keepalive_loop():
+    """Send NOOP periodically so the server doesn't close the idle session"""
+    while True:
+        time.sleep(SMTP_KEEPALIVE_SECONDS)
+        with _smtp_lock:
+            if _smtp_conn is None:
+                continue
+            try:
+                _smtp_conn.noop()
+            except Exception:
+                _close_smtp_connection()
+
+
+def send_smtp_message(msg):
+    """Send a message over the pooled SMTP connection, reconnecting once if it went stale"""
+    with _smtp_lock:
+        try:
+            _get_smtp_connection().send_message(msg)
+        except (smtplib.SMTPException, OSError):
+            _close_smtp_connection()
+            _get_smtp_connection().send_message(msg)
+# ================================
+
+
 def send_email_alert(ticker, signal, reasons):
     """Send email alert"""
     if not ENABLE_EMAIL_ALERTS:
@@ -980,10 +1169,7 @@ Take Profit: {tp}{rr_text}
         msg['From'] = EMAIL_FROM
         msg['To'] = EMAIL_TO
         
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USER, EMAIL_PASS)
-            server.send_message(msg)
+        send_smtp_message(msg)
         
         print(f"📧 Email sent for {ticker}")
         
@@ -992,6 +1178,8 @@ Take Profit: {tp}{rr_text}
 
 
 # ========= WEBHOOK ENDPOINTS =========
+# Dump each raw webhook payload to stdout (set DEBUG_WEBHOOK=1)
+DEBUG_WEBHOOK = os.environ.get("DEBUG_WEBHOOK") == "1"
 
 @app.route('/')
 def home():
@@ -999,43 +1187,72 @@ def home():
     return render_template('dashboard.html')
 
 
+# /api/status is polled by the dashboard - serve a cached payload for a short window
+STATUS_CACHE_SECONDS = 1.0
+_status_cache = {"payload": None, "built_at": 0.0}
+
+# The public tunnel URL essentially never changes - only re-check it once a minute
+PUBLIC_URL_REFRESH_SECONDS = 60
+_public_url_cache = {"url": None, "checked_at": None}
+
+
+def get_public_url():
+    """Get public URL - Railway domain first, then the local ngrok tunnel (cached)"""
+    railway_domain = os.environ.get('RAILWAY_PUBLIC_DOMAIN')
+    if railway_domain:
+        return f"https://{railway_domain}"
+    
+    now = time.monotonic()
+    checked_at = _public_url_cache["checked_at"]
+    if checked_at is not None and now - checked_at < PUBLIC_URL_REFRESH_SECONDS:
+        return _public_url_cache["url"]
+    
+    # Try ngrok for local development
+    public_url = None
+    try:
+        ngrok_response = http_requests.get('http://localhost:4040/api/tunnels', timeout=1)
+        tunnels = ngrok_response.json().get('tunnels', [])
+        for tunnel in tunnels:
+            if tunnel.get('proto') == 'https':
+                public_url = tunnel.get('public_url')
+                break
+        if not public_url and tunnels:
+            public_url = tunnels[0].get('public_url')
+    except Exception:
+        public_url = None
+    
+    _public_url_cache["url"] = public_url
+    _public_url_cache["checked_at"] = now
+    return public_url
+
+
 @app.route('/api/status')
 def api_status():
     """API endpoint for dashboard data"""
-    # Get public URL - check Railway first, then ngrok
-    public_url = os.environ.get('RAILWAY_PUBLIC_DOMAIN')
-    if public_url:
-        public_url = f"https://{public_url}"
-    else:
-        # Try ngrok for local development
-        try:
-            ngrok_response = http_requests.get('http://localhost:4040/api/tunnels', timeout=1)
-            tunnels = ngrok_response.json().get('tunnels', [])
-            for tunnel in tunnels:
-                if tunnel.get('proto') == 'https':
-                    public_url = tunnel.get('public_url')
-                    break
-            if not public_url and tunnels:
-                public_url = tunnels[0].get('public_url')
-        except Exception:
-            public_url = None
+    now = time.monotonic()
+    payload = _status_cache["payload"]
     
-    return jsonify({
-        "status": "running",
-        "scanner": "TradingView Webhook Futures Scanner",
-        "port": 5055,
-        "tickers": list(candle_storage["1m"].keys()),
-        "candles_stored": {
-            "1m": sum(len(v) for v in candle_storage["1m"].values()),
-            "5m": sum(len(v) for v in candle_storage["5m"].values()),
-            "15m": sum(len(v) for v in candle_storage["15m"].values())
-        },
-        "webhook_count": dashboard_stats["webhook_count"],
-        "signal_count": dashboard_stats["signal_count"],
-        "recent_signals": list(dashboard_stats["recent_signals"]),
-        "recent_logs": list(dashboard_stats["recent_logs"])[:10],
-        "ngrok_url": public_url
-    })
+    if payload is None or now - _status_cache["built_at"] >= STATUS_CACHE_SECONDS:
+        payload = {
+            "status": "running",
+            "scanner": "TradingView Webhook Futures Scanner",
+            "port": 5055,
+            "tickers": list(candle_storage["1m"].keys()),
+            "candles_stored": {
+                "1m": sum(len(v) for v in candle_storage["1m"].values()),
+                "5m": sum(len(v) for v in candle_storage["5m"].values()),
+                "15m": sum(len(v) for v in candle_storage["15m"].values())
+            },
+            "webhook_count": dashboard_stats["webhook_count"],
+            "signal_count": dashboard_stats["signal_count"],
+            "recent_signals": list(dashboard_stats["recent_signals"]),
+            "recent_logs": list(dashboard_stats["recent_logs"])[:10],
+            "ngrok_url": get_public_url()
+        }
+        _status_cache["payload"] = payload
+        _status_cache["built_at"] = now
+    
+    return json_response(payload)
 
 
 @app.route('/health')
@@ -1048,8 +1265,6 @@ def health():
 
 
 # ========= SETTINGS STORAGE =========
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'settings.json')
-
 def load_settings_from_file():
     """Load settings from JSON file"""
     default_settings = {
@@ -1067,13 +1282,37 @@ def load_settings_from_file():
     return default_settings
 
 def save_settings_to_file(settings):
-    """Save settings to JSON file"""
+    """Save settings to JSON file (atomic replace so readers never see a partial file)"""
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
     except Exception as e:
         print(f"Error saving settings: {e}")
 
+# Coalesce bursts of POSTs (slider drags) into a single write
+SETTINGS_SAVE_DEBOUNCE_SECONDS = 0.5
+_settings_save_timer = None
+_settings_save_lock = threading.Lock()
+
+def schedule_settings_save(settings):
+    """Write settings after a short quiet period, replacing any pending write"""
+    global _settings_save_timer
+    with _settings_save_lock:
+        if _settings_save_timer is not None:
+            _settings_save_timer.cancel()
+        _settings_save_timer = threading.Timer(SETTINGS_SAVE_DEBOUNCE_SECONDS, save_settings_to_file, args=(settings,))
+        _settings_save_timer.daemon = True
+        _settings_save_timer.start()
+
+@atexit.register
+def flush_settings_save():
+    """Write any still-pending settings on shutdown - the timer thread is a daemon"""
+    with _settings_save_lock:
+        timer = _settings_save_timer
+        if timer is None or timer.finished.is_set():
+            return
+        timer.cancel()
+    save_settings_to_file(*timer.args)
+
 scanner_settings = load_settings_from_file()
 
 
@@ -1106,7 +1345,7 @@ def update_settings():
             scanner_settings['tickers'] = data['tickers']
         
         # Save to file so futures scanner can read it
-        save_settings_to_file(scanner_settings)
+        schedule_settings_save(scanner_settings)
         
         add_log(f"Settings updated: interval={scanner_settings['scan_interval']}min, confidence={scanner_settings['min_confidence']}%", "success")
         
@@ -1123,7 +1362,7 @@ def get_trades():
         limit = request.args.get('limit', 15, type=int)  # Default 15, max 100
         limit = min(limit, 100)  # Cap at 100
         trades = get_recent_signals(limit=limit)
-        return jsonify(trades)
+        return json_response(trades)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1142,6 +1381,45 @@ def analyze_on_demand(ticker_symbol=None):
     })
 
 
+# Rendered cards keyed by the fields analyze_card.html reads, so refreshing
+# an unchanged analysis reuses the HTML instead of re-rendering it
+ROW_HTML_CACHE_SIZE = 256
+_row_html_cache = OrderedDict()
+_row_html_lock = threading.Lock()
+
+# Scalar result fields the card template renders
+CARD_FIELDS = (
+    'ticker', 'status', 'message', 'direction', 'confidence', 'daily_bias',
+    'tf15_trend', 'tf15_strength', 'tf5_trend', 'tf5_strength', 'tf1_trend', 'tf1_strength',
+    'orb_high', 'orb_low', 'pdh', 'pdl', 'entry', 'stop', 'target',
+    'all_criteria_met', 'stay_away_reason', 'entry_instruction'
+)
+
+def _row_html(r):
+    """Render one ticker card for the /analyze page (LRU-cached)"""
+    position = r.get('position_size') or {}
+    key = (
+        tuple(r.get(field) for field in CARD_FIELDS),
+        tuple(r.get('criteria_failed') or ()),
+        tuple(r.get('warnings', [])[:2]),
+        (position.get('contracts'), position.get('actual_risk'), position.get('potential_profit')),
+    )
+    
+    with _row_html_lock:
+        html = _row_html_cache.get(key)
+        if html is not None:
+            _row_html_cache.move_to_end(key)
+            return html
+    
+    html = app.jinja_env.get_template('analyze_card.html').render(r=r)
+    
+    with _row_html_lock:
+        _row_html_cache[key] = html
+        if len(_row_html_cache) > ROW_HTML_CACHE_SIZE:
+            _row_html_cache.popitem(last=False)
+    return html
+
+
 @app.route('/analyze', methods=['GET'])
 @app.route('/analyze/<ticker_symbol>', methods=['GET'])
 def analyze_mobile(ticker_symbol=None):
@@ -1152,338 +1430,26 @@ def analyze_mobile(ticker_symbol=None):
     """
     results = run_analysis(ticker_symbol, send_alerts=True)
     
-    # Build mobile-friendly HTML
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <title>SignalCrawler Analysis</title>
-        <style>
-            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-            body {{ 
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: #0a0a0f;
-                color: #e0e0e0;
-                padding: 20px;
-                min-height: 100vh;
-            }}
-            h1 {{ 
-                text-align: center; 
-                margin-bottom: 20px;
-                font-size: 1.5rem;
-                color: #fff;
-            }}
-            .time {{ 
-                text-align: center; 
-                color: #888; 
-                font-size: 0.8rem;
-                margin-bottom: 20px;
-            }}
-            .card {{
-                background: #1a1a24;
-                border-radius: 12px;
-                padding: 16px;
-                margin-bottom: 16px;
-                border: 1px solid #2a2a3a;
-            }}
-            .ticker {{ 
-                font-size: 1.4rem; 
-                font-weight: bold;
-                margin-bottom: 8px;
-            }}
-            .direction {{
-                display: inline-block;
-                padding: 6px 16px;
-                border-radius: 20px;
-                font-weight: bold;
-                font-size: 1rem;
-                margin-bottom: 12px;
-            }}
-            .long {{ background: #00c853; color: #000; }}
-            .short {{ background: #ff1744; color: #fff; }}
-            .stay_away {{ background: #666; color: #fff; }}
-            .insufficient {{ background: #333; color: #888; }}
-            .confidence {{
-                font-size: 2rem;
-                font-weight: bold;
-                margin: 8px 0;
-            }}
-            .conf-high {{ color: #00c853; }}
-            .conf-med {{ color: #ffc107; }}
-            .conf-low {{ color: #ff1744; }}
-            .prices {{
-                display: grid;
-                grid-template-columns: repeat(3, 1fr);
-                gap: 8px;
-                margin-top: 12px;
-            }}
-            .price-box {{
-                background: #0a0a0f;
-                padding: 8px;
-                border-radius: 8px;
-                text-align: center;
-            }}
-            .price-label {{ font-size: 0.7rem; color: #888; }}
-            .price-value {{ font-size: 1rem; font-weight: bold; }}
-            .warning {{
-                background: #332200;
-                border: 1px solid #664400;
-                padding: 8px;
-                border-radius: 8px;
-                margin-top: 8px;
-                font-size: 0.85rem;
-                color: #ffaa00;
-            }}
-            .btn {{
-                display: block;
-                width: 100%;
-                padding: 16px;
-                background: #4488ff;
-                color: #fff;
-                border: none;
-                border-radius: 12px;
-                font-size: 1.1rem;
-                font-weight: bold;
-                cursor: pointer;
-                margin-top: 20px;
-                text-decoration: none;
-                text-align: center;
-            }}
-            .btn:active {{ background: #3366cc; }}
-        </style>
-    </head>
-    <body>
-        <h1>🕷️ SignalCrawler v2.0</h1>
-        <div class="time">Analyzed: {est_time_str("%I:%M:%S %p")} EST</div>
-    '''
-    
-    # Check for news blackout and show banner
+    # Check for news blackout - otherwise show the next upcoming event
     is_news_blackout, news_event = check_news_blackout()
-    if is_news_blackout:
-        html += f'''
-        <div style="background:#4a1a1a;border:2px solid #ff4444;padding:12px;border-radius:8px;margin:12px 0;text-align:center;">
-            <div style="font-size:1.1rem;font-weight:bold;color:#ff4444;">🚫 NEWS BLACKOUT ACTIVE</div>
-            <div style="font-size:0.9rem;color:#ffaaaa;margin-top:4px;">📰 {news_event['event']}</div>
-            <div style="font-size:0.85rem;color:#888;margin-top:4px;">Clear in {news_event['minutes_until_clear']} min</div>
-        </div>
-        '''
-    else:
-        # Show upcoming events if any
+    next_event = None
+    if not is_news_blackout:
         upcoming = get_upcoming_events(days_ahead=2)
         if upcoming:
             next_event = upcoming[0]
-            html += f'''
-            <div style="background:#1a2a3a;border:1px solid #2a4a6a;padding:8px;border-radius:8px;margin:12px 0;text-align:center;">
-                <div style="font-size:0.8rem;color:#888;">📅 Next Event: {next_event['date']} {next_event['time']}</div>
-                <div style="font-size:0.85rem;color:#aaddff;">{next_event['event']}</div>
-            </div>
-            '''
-    
-    for r in results:
-        ticker = r.get('ticker', 'UNKNOWN')
-        status = r.get('status', '')
-        direction = r.get('direction', 'STAY_AWAY')
-        confidence = r.get('confidence', 0)
-        entry = r.get('entry')
-        stop = r.get('stop')
-        target = r.get('target')
-        rr = r.get('risk_reward', 0)
-        warnings = r.get('warnings', [])
-        stay_reason = r.get('stay_away_reason', '')
-        message = r.get('message', '')
-        
-        # v2.0 additions
-        daily_bias = r.get('daily_bias', 'UNKNOWN')
-        orb_high = r.get('orb_high')
-        orb_low = r.get('orb_low')
-        pdh = r.get('pdh')
-        pdl = r.get('pdl')
-        all_criteria_met = r.get('all_criteria_met', False)
-        criteria_met = r.get('criteria_met', [])
-        criteria_failed = r.get('criteria_failed', [])
-        
-        # Direction styling
-        if status == 'insufficient_data':
-            dir_class = 'insufficient'
-            dir_text = '⏳ LOADING'
-        elif direction == 'LONG':
-            dir_class = 'long'
-            dir_text = '🟢 LONG'
-        elif direction == 'SHORT':
-            dir_class = 'short'
-            dir_text = '🔴 SHORT'
-        else:
-            dir_class = 'stay_away'
-            dir_text = '⚪ STAY AWAY'
-        
-        # Confidence styling
-        conf_class = 'conf-high' if confidence >= 80 else 'conf-med' if confidence >= 70 else 'conf-low'
-        
-        # Bias styling
-        bias_emoji = '🟢' if daily_bias == 'LONG' else '🔴' if daily_bias == 'SHORT' else '⚪'
-        
-        html += f'''
-        <div class="card">
-            <div class="ticker">{ticker}</div>
-            <span class="direction {dir_class}">{dir_text}</span>
-        '''
-        
-        if status != 'insufficient_data':
-            html += f'''
-            <div class="confidence {conf_class}">{confidence}%</div>
-            '''
-            
-            # Daily Bias Box (NEW in v2.0)
-            html += f'''
-            <div style="background:#1a1a2a;border:1px solid #3a3a5a;padding:10px;border-radius:8px;margin:12px 0;text-align:center;">
-                <div style="font-size:0.75rem;color:#888;margin-bottom:4px;">DAILY BIAS (ORB)</div>
-                <div style="font-size:1.3rem;font-weight:bold;">{bias_emoji} {daily_bias}</div>
-            </div>
-            '''
-            
-            # Timeframe Trends (15m, 5m, 1m)
-            tf15_trend = r.get('tf15_trend', '?')
-            tf15_str = r.get('tf15_strength', '?')
-            tf5_trend = r.get('tf5_trend', '?')
-            tf5_str = r.get('tf5_strength', '?')
-            tf1_trend = r.get('tf1_trend', '?')
-            tf1_str = r.get('tf1_strength', '?')
-            
-            def trend_color(trend):
-                if trend == 'bullish': return '#00ff88'
-                if trend == 'bearish': return '#ff4466'
-                return '#888888'
-            
-            def trend_emoji(trend):
-                if trend == 'bullish': return '🟢'
-                if trend == 'bearish': return '🔴'
-                return '⚪'
-            
-            html += f'''
-            <div style="background:#1a1a24;border:1px solid #2a2a3a;padding:10px;border-radius:8px;margin:12px 0;">
-                <div style="font-size:0.75rem;color:#888;margin-bottom:8px;text-align:center;">TIMEFRAME TRENDS</div>
-                <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:8px;text-align:center;">
-                    <div style="background:#0a0a0f;padding:8px;border-radius:6px;">
-                        <div style="font-size:0.7rem;color:#666;">15m</div>
-                        <div style="font-size:0.95rem;font-weight:bold;color:{trend_color(tf15_trend)};">{trend_emoji(tf15_trend)} {tf15_trend.upper()}</div>
-                        <div style="font-size:0.65rem;color:#888;">{tf15_str}</div>
-                    </div>
-                    <div style="background:#0a0a0f;padding:8px;border-radius:6px;">
-                        <div style="font-size:0.7rem;color:#666;">5m</div>
-                        <div style="font-size:0.95rem;font-weight:bold;color:{trend_color(tf5_trend)};">{trend_emoji(tf5_trend)} {tf5_trend.upper()}</div>
-                        <div style="font-size:0.65rem;color:#888;">{tf5_str}</div>
-                    </div>
-                    <div style="background:#0a0a0f;padding:8px;border-radius:6px;">
-                        <div style="font-size:0.7rem;color:#666;">1m</div>
-                        <div style="font-size:0.95rem;font-weight:bold;color:{trend_color(tf1_trend)};">{trend_emoji(tf1_trend)} {tf1_trend.upper()}</div>
-                        <div style="font-size:0.65rem;color:#888;">{tf1_str}</div>
-                    </div>
-                </div>
-            </div>
-            '''
-            
-            # Key Levels (NEW in v2.0)
-            if orb_high or pdh:
-                html += '''
-                <div style="display:grid;grid-template-columns:1fr 1fr;gap:8px;margin:12px 0;">
-                '''
-                if orb_high and orb_low:
-                    html += f'''
-                    <div style="background:#1a2a1a;border:1px solid #2a4a2a;padding:8px;border-radius:8px;text-align:center;">
-                        <div style="font-size:0.7rem;color:#888;">ORB RANGE</div>
-                        <div style="font-size:0.9rem;color:#aaffaa;">{orb_low:.2f} - {orb_high:.2f}</div>
-                    </div>
-                    '''
-                if pdh and pdl:
-                    html += f'''
-                    <div style="background:#2a1a1a;border:1px solid #4a2a2a;padding:8px;border-radius:8px;text-align:center;">
-                        <div style="font-size:0.7rem;color:#888;">PDH / PDL</div>
-                        <div style="font-size:0.9rem;color:#ffaaaa;">{pdh:.2f} / {pdl:.2f}</div>
-                    </div>
-                    '''
-                html += '</div>'
-            
-            if entry and stop and target:
-                html += f'''
-                <div class="prices">
-                    <div class="price-box">
-                        <div class="price-label">ENTRY</div>
-                        <div class="price-value">{entry:.2f}</div>
-                    </div>
-                    <div class="price-box">
-                        <div class="price-label">STOP</div>
-                        <div class="price-value">{stop:.2f}</div>
-                    </div>
-                    <div class="price-box">
-                        <div class="price-label">TARGET</div>
-                        <div class="price-value">{target:.2f}</div>
-                    </div>
-                </div>
-                '''
-                html += f'<div style="text-align:center;margin-top:8px;color:#888;">R:R 2:1 (Fixed) | $250 Risk</div>'
-                
-                # Position sizing box
-                position = r.get('position_size', {})
-                if position:
-                    contracts = position.get('contracts', 1)
-                    actual_risk = position.get('actual_risk', 250)
-                    potential_profit = position.get('potential_profit', 500)
-                    html += f'''
-                    <div style="background:#1a2a3a;border:1px solid #2a4a6a;padding:12px;border-radius:8px;margin-top:12px;text-align:center;">
-                        <div style="font-size:1.5rem;font-weight:bold;color:#00d4ff;">{contracts} contracts</div>
-                        <div style="font-size:0.85rem;color:#888;margin-top:4px;">
-                            Risk: <span style="color:#ff4466">${actual_risk:.0f}</span> → 
-                            Profit: <span style="color:#00ff88">${potential_profit:.0f}</span>
-                        </div>
-                    </div>
-                    '''
-            
-            # Criteria Status (NEW in v2.0)
-            if all_criteria_met:
-                html += '''
-                <div style="background:#1a3a1a;border:2px solid #00ff88;padding:12px;border-radius:8px;margin-top:12px;text-align:center;">
-                    <div style="font-size:1.1rem;font-weight:bold;color:#00ff88;">✅ ALL CRITERIA MET</div>
-                    <div style="font-size:0.8rem;color:#aaffaa;margin-top:4px;">Trade Approved</div>
-                </div>
-                '''
-            elif criteria_failed:
-                html += '''
-                <div style="background:#3a1a1a;border:2px solid #ff4444;padding:12px;border-radius:8px;margin-top:12px;">
-                    <div style="font-size:0.9rem;font-weight:bold;color:#ff4444;margin-bottom:8px;">❌ CRITERIA NOT MET</div>
-                '''
-                for cf in criteria_failed:
-                    html += f'<div style="font-size:0.8rem;color:#ffaaaa;">{cf}</div>'
-                html += '</div>'
-            
-            if stay_reason:
-                html += f'<div class="warning">🚫 {stay_reason}</div>'
-            
-            for w in warnings[:2]:
-                html += f'<div class="warning">⚠️ {w}</div>'
-            
-            # Add entry instructions
-            entry_instruction = r.get('entry_instruction', '')
-            if entry_instruction and direction in ('LONG', 'SHORT') and all_criteria_met:
-                html += f'''
-                <div style="background:#1a2a1a;border:1px solid #2a4a2a;padding:12px;border-radius:8px;margin-top:12px;">
-                    <div style="font-weight:bold;color:#00ff88;margin-bottom:8px;">📝 Entry Instructions</div>
-                    <div style="font-size:0.9rem;white-space:pre-line;color:#aaffaa;">{entry_instruction}</div>
-                </div>
-                '''
-        else:
-            html += f'<div style="color:#888;margin-top:8px;">{message}</div>'
-        
-        html += '</div>'
     
-    html += '''
-        <a href="/analyze" class="btn">🔄 Refresh Analysis</a>
-        <a href="/" class="btn" style="background:#333;">📊 Full Dashboard</a>
-    </body>
-    </html>
-    '''
-    
-    return html
+    # Layout lives in templates/analyze_mobile.html (compiled once by Jinja),
+    # each ticker card in analyze_card.html - joined in one pass
+    cards_html = Markup("\n".join(_row_html(r) for r in results))
+    
+    return render_template(
+        'analyze_mobile.html',
+        cards_html=cards_html,
+        analyzed_at=est_time_str("%I:%M:%S %p"),
+        is_news_blackout=is_news_blackout,
+        news_event=news_event,
+        next_event=next_event
+    )
 
 
 def run_analysis(ticker_symbol=None, send_alerts=False):
@@ -1503,20 +1469,38 @@ def run_analysis(ticker_symbol=None, send_alerts=False):
         # Get market levels tracker
         market_lvls = get_market_levels()
         
+        # Per-run values that don't change between tickers - look them up once
+        store_1m, store_5m, store_15m = candle_storage["1m"], candle_storage["5m"], candle_storage["15m"]
+        update_levels = market_lvls.update_from_candles
+        min_conf = get_dynamic_min_confidence()
+        min_rr = MIN_RISK_REWARD
+        tier_info = f" ({get_tier_name()})" if TIME_TIERS_AVAILABLE else ""
+        blocked, block_msg = is_trading_blocked() if TIME_TIERS_AVAILABLE else (False, "")
+        
+        # Nothing can qualify during a news blackout - skip the MTF pipeline
+        if is_news_blackout:
+            news_reason = f"🚫 News: {news_event['event']} - Clear in {news_event['minutes_until_clear']} min"
+            if send_alerts:
+                add_log(f"{news_reason} - analysis skipped, no alerts", "warning")
+        
         for ticker in tickers_to_analyze:
             base_ticker = normalize_ticker(ticker)
             
-            # Get candle data
-            candles_1m = list(candle_storage["1m"].get(base_ticker, []))
-            candles_5m = list(candle_storage["5m"].get(base_ticker, []))
-            candles_15m = list(candle_storage["15m"].get(base_ticker, []))
+            # Get candle data - only copied out of storage when we'll analyze it
+            candles_1m = store_1m.get(base_ticker, ())
+            candles_5m = store_5m.get(base_ticker, ())
+            candles_15m = store_15m.get(base_ticker, ())
+            
+            enough_data = len(candles_1m) >= 10
+            if enough_data:
+                with candle_locks[base_ticker]:
+                    candles_1m, candles_5m, candles_15m = list(candles_1m), list(candles_5m), list(candles_15m)
             
-            # Update market levels from candle data
-            all_candles = candles_1m + candles_5m + candles_15m
-            if all_candles:
-                market_lvls.update_from_candles(ticker, all_candles)
+            # Update market levels from candle data (chained, no merged copy)
+            if candles_1m or candles_5m or candles_15m:
+                update_levels(ticker, chain(candles_1m, candles_5m, candles_15m))
             
-            if len(candles_1m) < 10:
+            if not enough_data:
                 results.append({
                     "ticker": ticker,
                     "status": "insufficient_data",
@@ -1524,6 +1508,30 @@ def run_analysis(ticker_symbol=None, send_alerts=False):
                 })
                 continue
             
+            if is_news_blackout:
+                levels_info = market_lvls.get_all_levels(ticker)
+                bias_info = levels_info.get('bias', {})
+                results.append({
+                    "ticker": ticker,
+                    "direction": "STAY_AWAY",
+                    "confidence": 0,
+                    "entry": None,
+                    "stay_away_reason": f"News blackout: {news_event['event']}",
+                    "daily_bias": bias_info.get('bias', 'UNKNOWN'),
+                    "bias_reason": bias_info.get('reason', ''),
+                    "orb_high": levels_info.get('orb', {}).get('high'),
+                    "orb_low": levels_info.get('orb', {}).get('low'),
+                    "pdh": levels_info.get('pdh_pdl', {}).get('pdh'),
+                    "pdl": levels_info.get('pdh_pdl', {}).get('pdl'),
+                    "all_criteria_met": False,
+                    "criteria_met": [],
+                    "criteria_failed": [news_reason],
+                    "news_blackout": True,
+                    "news_event": news_event['event'],
+                    "news_clear_in": news_event['minutes_until_clear']
+                })
+                continue
+            
             # Run MTF analysis
             mtf_result = mtf_analyze(candles_15m, candles_5m, candles_1m, ticker=ticker)
             
@@ -1559,11 +1567,6 @@ def run_analysis(ticker_symbol=None, send_alerts=False):
                     level_safe = False
                 
                 # Check confidence (tier-based)
-                min_conf = get_dynamic_min_confidence()
-                tier_info = ""
-                if TIME_TIERS_AVAILABLE:
-                    tier_info = f" ({get_tier_name()})"
-                
                 if confidence >= min_conf:
                     criteria_met.append(f"✅ Confidence: {confidence}% >= {min_conf}%{tier_info}")
                 else:
@@ -1571,18 +1574,15 @@ def run_analysis(ticker_symbol=None, send_alerts=False):
                 
                 # Check R:R
                 rr = mtf_result.get('risk_reward', 0)
-                if rr >= MIN_RISK_REWARD:
-                    criteria_met.append(f"✅ R:R: {rr}:1 >= {MIN_RISK_REWARD}:1")
+                if rr >= min_rr:
+                    criteria_met.append(f"✅ R:R: {rr}:1 >= {min_rr}:1")
                 else:
-                    criteria_failed.append(f"❌ R:R: {rr}:1 < {MIN_RISK_REWARD}:1")
+                    criteria_failed.append(f"❌ R:R: {rr}:1 < {min_rr}:1")
                 
                 # Check if trading blocked (overnight)
-                if TIME_TIERS_AVAILABLE:
-                    blocked, block_msg = is_trading_blocked()
-                    if blocked:
-                        criteria_failed.append(f"⛔ Blocked: {block_msg}")
+                if blocked:
+                    criteria_failed.append(f"⛔ Blocked: {block_msg}")
             
-            min_conf = get_dynamic_min_confidence()
             all_criteria_met = len(criteria_failed) == 0 and confidence >= min_conf and direction in ('LONG', 'SHORT')
             
             # Get timeframe trends from MTF analysis
@@ -1655,22 +1655,21 @@ def run_analysis(ticker_symbol=None, send_alerts=False):
                     add_log(f"📱 v2.0 Alert: {ticker} {direction} {confidence}% - {cooldown_reason}", "success")
                 else:
                     add_log(f"🔇 Skipped alert: {ticker} {direction} {confidence}% - {cooldown_reason}", "info")
-            elif send_alerts and direction in ('LONG', 'SHORT') and confidence >= get_dynamic_min_confidence():
+            elif send_alerts and direction in ('LONG', 'SHORT') and confidence >= min_conf:
                 # Log why not alerted
                 add_log(f"⚠️ {ticker} {direction} {confidence}% - Criteria failed: {', '.join(criteria_failed)}", "warning")
         
         return results
         
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        log.exception("run_analysis failed for %s", ticker_symbol or "all tickers")
         return [{"error": str(e)}]
 
 
 @app.route('/api/debug-signals', methods=['GET'])
 def debug_signals():
     """Debug endpoint to see signal processing details"""
-    recent = list(dashboard_stats.get("recent_signals", []))[:10]
+    recent = list(islice(dashboard_stats["recent_signals"], 10))
     return jsonify({
         "recent_signals": recent,
         "webhook_count": dashboard_stats.get("webhook_count", 0),
@@ -1686,7 +1685,7 @@ def api_check_outcomes():
     """Manually trigger outcome check for all pending trades"""
     try:
         from database import get_pending_signals
-        from outcome_tracker import get_current_price, normalize_ticker
+        from outcome_tracker import get_current_prices, normalize_ticker
         
         pending = get_pending_signals()
         
@@ -1696,10 +1695,12 @@ def api_check_outcomes():
         # Get debug info for remaining pending
         debug_info = []
         remaining_pending = get_pending_signals()
-        for signal in remaining_pending[:10]:  # Limit to 10 for response
+        shown = remaining_pending[:10]  # Limit to 10 for response
+        prices = get_current_prices(signal['ticker'] for signal in shown)
+        for signal in shown:
             ticker = signal['ticker']
             base_ticker = normalize_ticker(ticker)
-            current_price = get_current_price(ticker)
+            current_price = prices[ticker]
             
             debug_info.append({
                 'id': signal['id'],
@@ -1725,6 +1726,22 @@ def api_check_outcomes():
         return jsonify({"error": str(e)}), 500
 
 
+# Bound-parameter statements for marking outcomes (reused from SQLite's statement cache)
+MARK_OUTCOME_SQL = '''
+    UPDATE signal_recommendations 
+    SET outcome = ?, exit_price = ?, pnl_ticks = ?, exit_time = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+# SET expressions see the pre-UPDATE row, so win_rate adds the new
+# outcome to wins/losses itself (params: wins, losses, wins, wins, losses)
+STRATEGY_OUTCOME_SQL = '''
+    UPDATE strategy_versions 
+    SET wins = wins + ?, losses = losses + ?,
+        win_rate = ROUND(100.0 * (wins + ?) / NULLIF(wins + losses + ? + ?, 0), 1)
+    WHERE is_active = 1
+'''
+
+
 @app.route('/api/trade/<int:trade_id>/outcome', methods=['POST'])
 def mark_trade_outcome(trade_id):
     """Manually mark a trade as WIN or LOSS"""
@@ -1778,22 +1795,12 @@ def mark_trade_outcome(trade_id):
                         exit_price = stop
                     
                     # Update the trade
-                    cursor.execute('''
-                        UPDATE signal_recommendations 
-                        SET outcome = ?, exit_price = ?, pnl_ticks = ?, exit_time = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    ''', (outcome, exit_price, pnl, trade_id))
+                    cursor.execute(MARK_OUTCOME_SQL, (outcome, exit_price, pnl, trade_id))
                     
                     # Update strategy version stats (ignore errors)
                     try:
-                        cursor.execute(f'''
-                            UPDATE strategy_versions 
-                            SET {outcome.lower()}s = {outcome.lower()}s + 1,
-                                win_rate = CASE WHEN (wins + losses) > 0 
-                                           THEN ROUND(100.0 * wins / (wins + losses), 1) 
-                                           ELSE NULL END
-                            WHERE is_active = 1
-                        ''')
+                        is_win = 1 if outcome == 'WIN' else 0
+                        cursor.execute(STRATEGY_OUTCOME_SQL, (is_win, 1 - is_win, is_win, is_win, 1 - is_win))
                     except:
                         pass  # Non-critical
                     
@@ -2024,6 +2031,23 @@ def log_results():
         return jsonify({"error": str(e)}), 500
 
 
+# Test alert never changes - encode it once at startup
+TEST_DISCORD_BODY = json_bytes({
+    "username": "SignalCrawler",
+    "embeds": [{
+        "title": "🧪 TEST - MNQ LONG",
+        "description": "SignalCrawler is connected and working!",
+        "color": 0x00ff00,
+        "fields": [
+            {"name": "📊 Confidence", "value": "85%", "inline": True},
+            {"name": "📈 Entry", "value": "$21,500.25", "inline": True},
+            {"name": "🎯 Target", "value": "$21,520.00", "inline": True},
+        ],
+        "footer": {"text": "Test Alert from SignalCrawler"}
+    }]
+})
+
+
 @app.route('/api/test-discord', methods=['POST', 'GET'])
 def test_discord():
     """Send a test Discord alert"""
@@ -2043,33 +2067,9 @@ def test_discord():
             "got_prefix": webhook_url[:50] + "..." if len(webhook_url) > 50 else webhook_url
         }), 400
     
-    test_signal = {
-        'direction': 'LONG',
-        'confidence': 85,
-        'entry': 21500.25,
-        'stop': 21490.00,
-        'takeProfit': 21520.00,
-        'rationale': '🧪 TEST ALERT - SignalCrawler is connected and working!'
-    }
-    
     try:
         # Direct test with detailed error
-        payload = {
-            "username": "SignalCrawler",
-            "embeds": [{
-                "title": "🧪 TEST - MNQ LONG",
-                "description": "SignalCrawler is connected and working!",
-                "color": 0x00ff00,
-                "fields": [
-                    {"name": "📊 Confidence", "value": "85%", "inline": True},
-                    {"name": "📈 Entry", "value": "$21,500.25", "inline": True},
-                    {"name": "🎯 Target", "value": "$21,520.00", "inline": True},
-                ],
-                "footer": {"text": "Test Alert from SignalCrawler"}
-            }]
-        }
-        
-        response = http_requests.post(webhook_url, json=payload, timeout=10)
+        response = http_session.post(webhook_url, data=TEST_DISCORD_BODY, headers=JSON_HEADERS, timeout=10)
         
         if response.status_code in [200, 204]:
             return jsonify({"status": "success", "message": "Test alert sent to Discord! Check your channel."})
@@ -2194,10 +2194,18 @@ def news_upcoming():
 
 @app.route('/api/analytics')
 def get_analytics():
-    """Get full analytics data"""
+    """Get full analytics data - sections encoded with orjson and joined"""
     try:
-        analytics = get_full_analytics()
-        return jsonify(analytics)
+        if not ORJSON_AVAILABLE:
+            return json_response(get_full_analytics())
+        
+        # Build and encode every section before responding, so a failing
+        # builder still returns a 500 instead of a truncated body
+        chunks = [
+            orjson.dumps(name) + b':' + orjson.dumps(build(), option=ORJSON_OPTIONS)
+            for name, build in ANALYTICS_SECTIONS
+        ]
+        return Response(b'{' + b','.join(chunks) + b'}', mimetype='application/json')
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2208,7 +2216,7 @@ def get_winrate_chart():
     try:
         days = request.args.get('days', 30, type=int)
         data = get_win_rate_chart_data(days)
-        return jsonify(data)
+        return json_response(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2219,7 +2227,7 @@ def get_pnl_chart():
     try:
         days = request.args.get('days', 30, type=int)
         data = get_pnl_chart_data(days)
-        return jsonify(data)
+        return json_response(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2229,7 +2237,7 @@ def get_tickers_analytics():
     """Get ticker performance analytics"""
     try:
         data = get_ticker_performance()
-        return jsonify(data)
+        return json_response(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2239,7 +2247,7 @@ def get_hourly_analytics():
     """Get hourly distribution analytics"""
     try:
         data = get_hourly_distribution()
-        return jsonify(data)
+        return json_response(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2249,7 +2257,7 @@ def get_confidence_analytics():
     """Get confidence level performance"""
     try:
         data = get_confidence_performance()
-        return jsonify(data)
+        return json_response(data)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -2352,7 +2360,7 @@ def manual_scan(ticker):
         if direction != 'no_trade':
             add_log(f"📊 Manual scan: {ticker} {direction.upper()} {confidence}%", "info")
         
-        return jsonify(result)
+        return json_response(result)
         
     except Exception as e:
         print(f"⚠️  Manual scan error: {e}")
@@ -2362,18 +2370,19 @@ def manual_scan(ticker):
 @app.route('/api/candles/status', methods=['GET'])
 def candle_status():
     """Get current candle history status"""
+    c1, c5, c15 = candle_storage["1m"], candle_storage["5m"], candle_storage["15m"]
     status = {}
-    for ticker in set(list(candle_storage["1m"].keys()) + ["MNQ", "MES", "MGC"]):
-        status[ticker] = {
-            "1m": len(candle_storage["1m"].get(ticker, [])),
-            "5m": len(candle_storage["5m"].get(ticker, [])),
-            "15m": len(candle_storage["15m"].get(ticker, []))
-        }
-    
-    total_1m = sum(s["1m"] for s in status.values())
-    ready = all(s["1m"] >= 50 and s["5m"] >= 3 for s in status.values() if s["1m"] > 0)
-    
-    return jsonify({
+    total_1m = 0
+    ready = True
+    for ticker in c1.keys() | {"MNQ", "MES", "MGC"}:
+        one = len(c1.get(ticker, ()))
+        five = len(c5.get(ticker, ()))
+        status[ticker] = {"1m": one, "5m": five, "15m": len(c15.get(ticker, ()))}
+        total_1m += one
+        if one > 0 and (one < 50 or five < 3):
+            ready = False
+    
+    return json_response({
         "tickers": status,
         "total_candles": total_1m,
         "ready_for_analysis": ready,
@@ -2395,8 +2404,9 @@ def clear_candles():
     
     # Clear memory
     for tf in ["1m", "5m", "15m"]:
-        for ticker in candle_storage[tf]:
-            candle_storage[tf][ticker].clear()
+        for ticker, ring in candle_storage[tf].items():
+            with candle_locks[ticker]:
+                ring.clear()
     
     # Clear JSON file
     if os.path.exists(CANDLE_HISTORY_FILE):
@@ -2415,7 +2425,7 @@ def candle_db_status():
     try:
         counts = get_candle_counts()
         total = sum(sum(tf.values()) for tf in counts.values())
-        return jsonify({
+        return json_response({
             "total_candles": total,
             "by_ticker": counts,
             "storage": "SQLite database"
@@ -2431,11 +2441,9 @@ def scan_all_tickers():
         results = []
         
         # Get all tickers that actually have data stored (from TradingView webhooks)
-        stored_tickers = set()
-        for tf in ["1m", "5m", "15m"]:
-            for ticker in candle_storage[tf].keys():
-                if len(candle_storage["1m"].get(ticker, [])) > 0:
-                    stored_tickers.add(ticker)
+        # - a ticker counts only once it has 1m candles, so one pass over 1m is enough
+        store_5m, store_15m = candle_storage["5m"], candle_storage["15m"]
+        stored_tickers = [t for t, candles in candle_storage["1m"].items() if len(candles) > 0]
         
         if not stored_tickers:
             return jsonify({"error": "No candle data stored yet", "results": []})
@@ -2443,23 +2451,26 @@ def scan_all_tickers():
         for ticker in stored_tickers:
             print(f"\n🔍 Scanning {ticker}...")
             
-            # Get stored candle data
-            candles_1m = list(candle_storage["1m"].get(ticker, []))
-            candles_5m = list(candle_storage["5m"].get(ticker, []))
-            candles_15m = list(candle_storage["15m"].get(ticker, []))
+            # Get stored candle data (counted before anything is copied out)
+            ring_1m = candle_storage["1m"][ticker]
+            ring_5m = store_5m.get(ticker) or ()
+            ring_15m = store_15m.get(ticker) or ()
+            n1, n5, n15 = len(ring_1m), len(ring_5m), len(ring_15m)
             
-            print(f"   Data: {len(candles_1m)} x 1m, {len(candles_5m)} x 5m, {len(candles_15m)} x 15m")
+            print(f"   Data: {n1} x 1m, {n5} x 5m, {n15} x 15m")
             
-            if len(candles_1m) < 15 or len(candles_5m) < 3 or len(candles_15m) < 2:
+            if n1 < 15 or n5 < 3 or n15 < 2:
                 results.append({
                     "ticker": ticker,
-                    "error": f"Insufficient data: {len(candles_1m)}x1m, {len(candles_5m)}x5m, {len(candles_15m)}x15m",
+                    "error": f"Insufficient data: {n1}x1m, {n5}x5m, {n15}x15m",
                     "direction": "no_trade",
                     "htf_bias": "NEUTRAL"
                 })
                 continue
             
-            # Run MTF analysis
+            # Run MTF analysis on a snapshot - the lock is released before analyzing
+            with candle_locks[ticker]:
+                candles_15m, candles_5m, candles_1m = list(ring_15m), list(ring_5m), list(ring_1m)
             result = mtf_analyze(candles_15m, candles_5m, candles_1m, ticker)
             results.append(result)
             
@@ -2472,7 +2483,7 @@ def scan_all_tickers():
             if direction != 'no_trade':
                 add_log(f"📊 Scan: {ticker} {direction.upper()} {confidence}%", "success")
         
-        return jsonify({
+        return json_response({
             "timestamp": dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             "results": results,
             "signals": [r for r in results if r.get('direction') != 'no_trade']
@@ -2484,18 +2495,9 @@ def scan_all_tickers():
 
 
 # ========= TEST EMAIL =========
-
-@app.route('/api/test-email', methods=['GET'])
-def test_email():
-    """Send a test email to verify email configuration"""
-    if not EMAIL_USER or not EMAIL_PASS:
-        return jsonify({"error": "Email not configured. Set EMAIL_USER and EMAIL_PASS environment variables."}), 400
-    
-    try:
-        import smtplib
-        from email.mime.text import MIMEText
-        
-        msg = MIMEText(f"""
+# Only the timestamp changes between test emails
+TEST_EMAIL_SUBJECT = "🎯 Test Alert - Prop Firm Scanner"
+TEST_EMAIL_HEAD = """
 🎯 Prop Firm Scanner - Test Email
 
 This is a test email to verify your alert system is working!
@@ -2503,18 +2505,26 @@ This is a test email to verify your alert system is working!
 If you received this, your email alerts are configured correctly.
 
 Scanner URL: https://web-production-23cc7.up.railway.app
-Time: {dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Time: """
+TEST_EMAIL_TAIL = """
 
 You will receive alerts like this when the scanner finds valid trade signals.
-        """)
-        msg['Subject'] = "🎯 Test Alert - Prop Firm Scanner"
+        """
+
+@app.route('/api/test-email', methods=['GET'])
+def test_email():
+    """Send a test email to verify email configuration"""
+    if not EMAIL_USER or not EMAIL_PASS:
+        return jsonify({"error": "Email not configured. Set EMAIL_USER and EMAIL_PASS environment variables."}), 400
+    
+    try:
+        msg = MIMEText(TEST_EMAIL_HEAD + dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S') + TEST_EMAIL_TAIL)
+        msg['Subject'] = TEST_EMAIL_SUBJECT
         msg['From'] = EMAIL_USER
         msg['To'] = EMAIL_TO
         
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USER, EMAIL_PASS)
-            server.send_message(msg)
+        # Sent inline (not queued) so configuration errors come back to the caller
+        send_smtp_message(msg)
         
         return jsonify({"status": "success", "message": f"Test email sent to {EMAIL_TO}"})
     except Exception as e:
@@ -2699,7 +2709,8 @@ def webhook():
         print(f"\n{'='*60}")
         print(f"🔔 WEBHOOK RECEIVED: {ticker} {timeframe}")
         print(f"{'='*60}")
-        print(f"Data: {json.dumps(data, indent=2)}")
+        if DEBUG_WEBHOOK:
+            print(f"Data: {json.dumps(data, indent=2)}")
         
         # Store the candle - CONVERT TIME TO EST
         raw_time = data.get("time")
@@ -2724,10 +2735,11 @@ def webhook():
             raw_ticker = ticker.split(":")[0] if ":" in ticker else ticker
             base_ticker = normalize_ticker(raw_ticker)
             
-            # Get TradingView webhook data
-            candles_1m = list(candle_storage["1m"].get(base_ticker, []))
-            candles_5m = list(candle_storage["5m"].get(base_ticker, []))
-            candles_15m = list(candle_storage["15m"].get(base_ticker, []))
+            # Get TradingView webhook data - the rings are only copied out
+            # once we know this tick will actually be analyzed
+            candles_1m = candle_storage["1m"].get(base_ticker, ())
+            candles_5m = candle_storage["5m"].get(base_ticker, ())
+            candles_15m = candle_storage["15m"].get(base_ticker, ())
             
             # Show current data status (5m/15m are auto-aggregated from 1m)
             print(f"   📊 Data: {len(candles_1m)} x 1m → {len(candles_5m)} x 5m (auto), {len(candles_15m)} x 15m (auto)")
@@ -2752,11 +2764,11 @@ def webhook():
                 return jsonify({"status": "stored", "message": "Aggregating 15m candles..."}), 200
             
             # Check if we should analyze (every N minutes, not every candle)
-            now = dt.datetime.now()
+            now = time.monotonic()
             last_time = last_analysis_time.get(base_ticker)
             
-            if last_time:
-                elapsed = (now - last_time).total_seconds() / 60
+            if last_time is not None:
+                elapsed = (now - last_time) / 60
                 print(f"⏱️ {base_ticker}: Last analysis {elapsed:.1f} min ago (interval: {ANALYSIS_INTERVAL_MINUTES} min)")
                 if elapsed < ANALYSIS_INTERVAL_MINUTES:
                     remaining = ANALYSIS_INTERVAL_MINUTES - elapsed
@@ -2767,7 +2779,10 @@ def webhook():
             
             # Update last analysis time
             last_analysis_time[base_ticker] = now
-            print(f"⏱️ {base_ticker}: Analysis time set to {now.strftime('%H:%M:%S')}")
+            print(f"⏱️ {base_ticker}: Analysis time set to {dt.datetime.now().strftime('%H:%M:%S')}")
+            
+            with candle_locks[base_ticker]:
+                candles_1m, candles_5m, candles_15m = list(candles_1m), list(candles_5m), list(candles_15m)
             
             print(f"\n📊 Running MTF Analysis on {ticker}...")
             print(f"   Data: {len(candles_15m)} x 15m, {len(candles_5m)} x 5m, {len(candles_1m)} x 1m")
@@ -2824,12 +2839,19 @@ def webhook():
             if direction != "no_trade":
                 # Update market levels from candle data (v2.0)
                 market_lvls = get_market_levels()
-                all_candles = candles_1m + candles_5m + candles_15m
-                if all_candles:
-                    market_lvls.update_from_candles(ticker, all_candles)
+                if candles_1m or candles_5m or candles_15m:
+                    market_lvls.update_from_candles(ticker, chain(candles_1m, candles_5m, candles_15m))
                 
                 # Validate signal with v2.0 criteria (includes bias + level checks)
-                is_valid, reasons = validate_signal(signal, ticker)
+                # - below the tier threshold it can never pass, so skip the checks
+                # (unless trading is blocked - validate_signal reports that first)
+                min_conf = get_dynamic_min_confidence()
+                blocked_overnight = TIME_TIERS_AVAILABLE and is_trading_blocked()[0]
+                if confidence < min_conf and not blocked_overnight:
+                    tier_name = get_tier_name() if TIME_TIERS_AVAILABLE else "DEFAULT"
+                    is_valid, reasons = False, [f"❌ Confidence {confidence}% below {tier_name} threshold {min_conf}%"]
+                else:
+                    is_valid, reasons = validate_signal(signal, ticker)
                 signal_entry["valid"] = is_valid
                 
                 print(f"\n🔍 SignalCrawler v2.0 Quality Check:")
@@ -2837,7 +2859,7 @@ def webhook():
                     print(f"   {reason}")
                 
                 # v2.0: Only alert when ALL criteria are met
-                if is_valid and confidence >= get_dynamic_min_confidence():
+                if is_valid and confidence >= min_conf:
                     print(f"\n✅ ALL CRITERIA MET: {ticker} {direction.upper()} {confidence}%")
                     
                     entry_price = signal.get('entry') or signal.get('currentPrice') or 0
@@ -2856,12 +2878,10 @@ def webhook():
                             'rationale': signal.get('rationale', '')
                         }
                         
-                        try:
-                            send_discord_alert(ticker, discord_signal, mtf_result)
-                            record_alert_sent(ticker, direction.upper(), entry_price, confidence)
-                            print(f"📱 Alert sent: {cooldown_reason}")
-                        except Exception as e:
-                            print(f"⚠️ Discord failed: {e}")
+                        # Record before queueing so a quick repeat webhook hits the cooldown
+                        record_alert_sent(ticker, direction.upper(), entry_price, confidence)
+                        alert_executor.submit(send_discord_alert, ticker, discord_signal, mtf_result)
+                        print(f"📱 Alert queued: {cooldown_reason}")
                     else:
                         print(f"🔇 Alert skipped: {cooldown_reason}")
                 elif confidence >= 70:
@@ -2894,7 +2914,7 @@ def webhook():
                     }
                     signal_id = save_signal(signal_to_save)
                     print(f"📍 Signal #{signal_id} saved to Trade Journal")
-                    send_email_alert(ticker, signal, reasons)
+                    alert_executor.submit(send_email_alert, ticker, signal, reasons)
                 else:
                     add_log(f"⛔ Rejected: {ticker} {direction.upper()} {confidence}%", "warning")
             else:
@@ -2976,6 +2996,26 @@ def open_browser():
     webbrowser.open('http://localhost:5055')
 
 
+def signal_entry_from_db(sig):
+    """Dashboard recent-signal entry for a saved trade journal row"""
+    # Extract time from timestamp or time_of_day
+    ts = sig.get('time_of_day') or sig.get('timestamp', '')
+    time_str = ts[-8:] if len(ts) >= 8 else ts  # Get HH:MM:SS part
+    
+    return {
+        "time": time_str,  # Dashboard looks for "time" key
+        "ticker": sig.get('ticker', ''),
+        "direction": sig.get('direction', ''),
+        "confidence": sig.get('confidence', 0),
+        "entry": sig.get('entry_price'),
+        "stop": sig.get('stop_price'),
+        "target": sig.get('target_price'),
+        "rationale": sig.get('rationale', ''),
+        "valid": sig.get('outcome') != 'PENDING',  # Show valid status
+        "outcome": sig.get('outcome', 'PENDING')
+    }
+
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🕷️ SIGNALCRAWLER v3.0 STARTING")
@@ -3015,32 +3055,20 @@ if __name__ == '__main__':
     print("📊 Loading recent signals from database...")
     try:
         db_signals = get_recent_signals(limit=50)
-        for sig in reversed(db_signals):  # Oldest first so newest ends up at front
-            # Extract time from timestamp or time_of_day
-            ts = sig.get('time_of_day') or sig.get('timestamp', '')
-            time_str = ts[-8:] if len(ts) >= 8 else ts  # Get HH:MM:SS part
-            
-            signal_entry = {
-                "time": time_str,  # Dashboard looks for "time" key
-                "ticker": sig.get('ticker', ''),
-                "direction": sig.get('direction', ''),
-                "confidence": sig.get('confidence', 0),
-                "entry": sig.get('entry_price'),
-                "stop": sig.get('stop_price'),
-                "target": sig.get('target_price'),
-                "rationale": sig.get('rationale', ''),
-                "valid": sig.get('outcome') != 'PENDING',  # Show valid status
-                "outcome": sig.get('outcome', 'PENDING')
-            }
-            dashboard_stats["recent_signals"].appendleft(signal_entry)
+        # Oldest first so newest ends up at front
+        dashboard_stats["recent_signals"].extendleft(map(signal_entry_from_db, reversed(db_signals)))
         print(f"   Loaded {len(db_signals)} recent signals")
     except Exception as e:
         print(f"⚠️  Could not load recent signals: {e}")
     
     print("📊 Outcome tracking: MANUAL ONLY (use Check Outcomes button)")
     
+    # Pay the numba compile cost now rather than on the first webhook
+    warm_kernels()
+    
     # Use PORT env var for cloud deployment, default to 5055 for local
     port = int(os.environ.get("PORT", 5055))
+    wsgi_threads = int(os.environ.get("WSGI_THREADS", 8))
     
     # Check if running on Railway (skip ngrok)
     railway_domain = os.environ.get('RAILWAY_PUBLIC_DOMAIN')
@@ -3061,6 +3089,11 @@ if __name__ == '__main__':
     print(f"💊 Health: http://localhost:{port}/health")
     print("="*60 + "\n")
     
-    # Run Flask (use_reloader=False to prevent double ngrok)
-    app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+    if WAITRESS_AVAILABLE:
+        # Waitress worker threads handle webhook bursts concurrently
+        print(f"🚀 Serving with waitress ({wsgi_threads} threads)")
+        waitress_serve(app, host='0.0.0.0', port=port, threads=wsgi_threads)
+    else:
+        # Run Flask (use_reloader=False to prevent double ngrok)
+        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False, threaded=True)
 
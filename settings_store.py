@@ -0,0 +1,26 @@
+"""
+Settings Store
+Single writer for settings.json, shared by the scanner, suggestion manager,
+AI tuning and prompt evolver.
+
+Writes go to a temp file that is swapped in with os.replace, so a reader
+(or a crash mid-write) never sees a partial file. The lock keeps writers
+in different threads from sharing the temp file.
+"""
+
+import json
+import os
+import threading
+
+SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
+
+_write_lock = threading.Lock()
+
+
+def write_settings(settings):
+    """Atomically replace settings.json - raises on failure so callers keep their own handling"""
+    with _write_lock:
+        tmp_file = SETTINGS_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(settings, f, separators=(',', ':'))
+        os.replace(tmp_file, SETTINGS_FILE)
@@ -14,15 +14,19 @@ Features:
 import json
 import os
 import re
+import time
 from datetime import datetime, timedelta
-from collections import defaultdict
 import math
 
+import numpy as np
+
 # Import shared database connection
 from database import get_connection
+from numba_compat import njit, kernel_array
 
 
 # Statistical helper functions
+@njit(cache=True)
 def calculate_significance(wins1, total1, wins2, total2):
     """
     Calculate if difference between two win rates is statistically significant
@@ -56,24 +60,195 @@ def calculate_significance(wins1, total1, wins2, total2):
         return 0.5
 
 
+@njit(cache=True)
+def _significance_kernel(wins1, totals1, wins2, total2):
+    """calculate_significance for every bucket against the same baseline"""
+    out = np.empty(len(wins1))
+    for i in range(len(wins1)):
+        out[i] = calculate_significance(wins1[i], totals1[i], wins2, total2)
+    return out
+
+
+def calculate_significance_batch(wins1, totals1, wins2, total2):
+    """
+    p-value estimates for a list of buckets vs the baseline (wins2/total2)
+    in one call, instead of one calculate_significance call per bucket
+    """
+    if not wins1:
+        return []
+    return _significance_kernel(kernel_array(wins1), kernel_array(totals1), wins2, total2).tolist()
+
+
+# The coach panel asks for insights and the full analysis back to back -
+# reuse the fetched trades for a short while instead of re-querying
+TRADE_DATA_CACHE_SECONDS = 30
+_trade_data_cache = {}  # {min_trades: (fetched_at, (bundle, error))}
+
+
 def get_trade_data(min_trades=20):
-    """Get all completed trades for analysis"""
+    """
+    Get all completed trades for analysis as a TradeBundle.
+    Result is memoized per min_trades for TRADE_DATA_CACHE_SECONDS.
+    """
+    now_mono = time.monotonic()
+    cached = _trade_data_cache.get(min_trades)
+    if cached is not None and now_mono - cached[0] < TRADE_DATA_CACHE_SECONDS:
+        return cached[1]
+    
+    result = _fetch_trade_data(min_trades)
+    _trade_data_cache[min_trades] = (now_mono, result)
+    return result
+
+
+def _fetch_trade_data(min_trades):
+    """Query completed trades and their bucket aggregates"""
     conn = get_connection()
     cursor = conn.cursor()
     
+    # Count first - with too few trades there's nothing worth fetching
+    cursor.execute('''
+        SELECT COUNT(*) as total FROM signals
+        WHERE outcome IN ('win', 'loss') AND is_valid = 1
+    ''')
+    total = cursor.fetchone()['total']
+    
+    if total < min_trades:
+        conn.close()
+        return None, f"Need at least {min_trades} trades for analysis (have {total})"
+    
+    # Only the columns the analyzers read per trade - everything bucketed
+    # comes from get_trade_aggregates()
     cursor.execute('''
-        SELECT * FROM signals
+        SELECT outcome, rationale, entry_price, stop_price, target_price
+        FROM signals
         WHERE outcome IN ('win', 'loss') AND is_valid = 1
         ORDER BY timestamp DESC
     ''')
     
     rows = cursor.fetchall()
+    bundle = TradeBundle(rows, get_trade_aggregates(cursor))
     conn.close()
+    return bundle, None
+
+
+class TradeBundle:
+    """
+    Completed trades plus the totals every analyzer needs - built once per
+    analysis so the analyzers don't each rescan the rows for them
+    """
     
-    if len(rows) < min_trades:
-        return None, f"Need at least {min_trades} trades for analysis (have {len(rows)})"
+    def __init__(self, rows, aggregates):
+        # Column arrays straight from the (outcome, rationale, entry, stop,
+        # target) rows, newest first - no per-trade dict
+        outcomes, rationales, entries, stops, targets = zip(*rows) if rows else ((),) * 5
+        self.outcomes = np.array(outcomes, dtype=object)
+        self.rationales = rationales
+        self.rr = risk_reward_array(entries, stops, targets)
+        self.aggregates = aggregates    # get_trade_aggregates() buckets
+        self.total = len(outcomes)
+        self.win_mask = self.outcomes == 'win'
+        self.wins = int(self.win_mask.sum())
+        self.win_rate = self.wins / self.total * 100 if self.total else 0
+
+
+def price_array(values):
+    """Price column as float64 - missing, zero or non-numeric prices become NaN"""
+    try:
+        prices = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        prices = np.array([_to_price(value) for value in values], dtype=np.float64)
+    prices[prices == 0] = np.nan
+    return prices
+
+
+def _to_price(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def risk_reward_array(entries, stops, targets):
+    """R:R per trade (reward / risk), NaN where prices are missing or risk is 0"""
+    entry = price_array(entries)
+    risk = np.abs(entry - price_array(stops))
+    reward = np.abs(price_array(targets) - entry)
+    rr = np.full(len(entry), np.nan)
+    np.divide(reward, risk, out=rr, where=risk > 0)
+    return rr
+
+
+# SQL bucket expression for each aggregate group
+# (weekday is shifted from SQLite's 0=Sunday to Python's 0=Monday)
+AGGREGATE_GROUPS = {
+    'ticker': "ticker",
+    'entry_type': "entry_type",
+    'direction': "direction",
+    'hour': "CAST(strftime('%H', timestamp) AS INTEGER)",
+    'weekday': "(CAST(strftime('%w', timestamp) AS INTEGER) + 6) % 7",
+    'confidence': "CAST(confidence / 5 AS INTEGER) * 5",
+}
+
+
+def get_trade_aggregates(cursor):
+    """
+    Get win/loss counts per bucket for completed trades
     
-    return [dict(row) for row in rows], None
+    SQLite does the grouping - returns {group: BucketStats} for every group
+    in AGGREGATE_GROUPS (confidence is bucketed to 5 points)
+    """
+    aggregates = {}
+    for group, expression in AGGREGATE_GROUPS.items():
+        cursor.execute(f'''
+            SELECT 
+                {expression} as bucket,
+                COUNT(*) as total,
+                SUM(CASE WHEN outcome = 'win' THEN 1 ELSE 0 END) as wins,
+                SUM(COALESCE(pnl_ticks, 0)) as pnl
+            FROM signals
+            WHERE outcome IN ('win', 'loss') AND is_valid = 1
+            GROUP BY bucket
+        ''')
+        
+        aggregates[group] = BucketStats(cursor.fetchall())
+    
+    return aggregates
+
+
+class BucketStats:
+    """
+    One aggregate group as parallel columns - bucket keys plus matching
+    total/win/P&L arrays (no per-bucket dict)
+    """
+    
+    def __init__(self, rows):
+        keys, totals, wins, pnl = zip(*rows) if rows else ((),) * 4
+        self.keys = list(keys)
+        self.totals = np.array(totals, dtype=np.int64)
+        self.wins = np.array(wins, dtype=np.int64)
+        self.pnl = np.array(pnl, dtype=np.float64)
+    
+    def index(self, key):
+        """Column position of a bucket (None if it has no trades)"""
+        return self.keys.index(key) if key in self.keys else None
+    
+    def known(self):
+        """Column positions of the non-None buckets, in bucket order"""
+        return sorted((i for i, key in enumerate(self.keys) if key is not None),
+                      key=self.keys.__getitem__)
+    
+    def dense(self, size):
+        """
+        Spread small integer buckets (hour, weekday) into fixed-size
+        total/win arrays - None buckets (unparseable timestamps) are dropped
+        """
+        known = self.known()
+        totals = np.zeros(size, dtype=np.int64)
+        wins = np.zeros(size, dtype=np.int64)
+        positions = [self.keys[i] for i in known]
+        totals[positions] = self.totals[known]
+        wins[positions] = self.wins[known]
+        return totals, wins
 
 
 # ============ ANALYZER MODULES ============
@@ -92,82 +267,93 @@ class PromptEvolutionAnalyzer:
         'change of character', 'imbalance', 'mitigation'
     ]
     
-    def analyze(self, trades):
+    # All phrases in one regex - the lookahead lets matches overlap, so a
+    # single scan finds exactly what a substring test per phrase would
+    PHRASE_RE = re.compile('(?=(' + '|'.join(map(re.escape, KEY_PHRASES)) + '))')
+    PHRASE_ID = {phrase: i for i, phrase in enumerate(KEY_PHRASES)}
+    
+    def analyze(self, bundle):
         """Analyze rationales for winning vs losing patterns"""
-        if not trades:
+        if not bundle.total:
             return []
         
         suggestions = []
-        phrase_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'total': 0})
+        phrase_ids = []     # One phrase ID per (trade, phrase mentioned)
+        win_ids = []        # Same, for winning trades only
         
         # Count phrase occurrences in wins vs losses
-        for trade in trades:
-            rationale = (trade.get('rationale') or '').lower()
-            outcome = trade['outcome']
+        for rationale, won in zip(bundle.rationales, bundle.win_mask.tolist()):
+            if not rationale:
+                continue
             
-            for phrase in self.KEY_PHRASES:
-                if phrase in rationale:
-                    phrase_stats[phrase]['total'] += 1
-                    if outcome == 'win':
-                        phrase_stats[phrase]['wins'] += 1
-                    else:
-                        phrase_stats[phrase]['losses'] += 1
+            ids = {self.PHRASE_ID[phrase] for phrase in self.PHRASE_RE.findall(rationale.lower())}
+            phrase_ids.extend(ids)
+            if won:
+                win_ids.extend(ids)
+        
+        num_phrases = len(self.KEY_PHRASES)
+        totals = np.bincount(np.array(phrase_ids, dtype=np.intp), minlength=num_phrases)
+        wins = np.bincount(np.array(win_ids, dtype=np.intp), minlength=num_phrases)
+        rates = (wins / np.maximum(totals, 1) * 100).tolist()
+        totals, wins = totals.tolist(), wins.tolist()
         
         # Calculate overall win rate
-        total_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        overall_rate = total_wins / len(trades) * 100
+        total_wins = bundle.wins
+        overall_rate = bundle.win_rate
+        
+        # Only phrases seen often enough and 10+ points off the overall
+        # rate can produce a suggestion - check significance for just those
+        candidates = [i for i in range(num_phrases)
+                      if totals[i] >= 5 and abs(rates[i] - overall_rate) >= 10]
+        p_values = calculate_significance_batch(
+            [wins[i] for i in candidates], [totals[i] for i in candidates],
+            total_wins, bundle.total
+        )
         
         # Find phrases with significantly different win rates
-        for phrase, stats in phrase_stats.items():
-            if stats['total'] < 5:
-                continue
-            
-            phrase_rate = stats['wins'] / stats['total'] * 100
+        survivors = [(i, p_value) for i, p_value in zip(candidates, p_values) if p_value < 0.1]
+        
+        for i, p_value in survivors:
+            phrase = self.KEY_PHRASES[i]
+            phrase_rate = rates[i]
             diff = phrase_rate - overall_rate
             
-            # Check statistical significance
-            p_value = calculate_significance(
-                stats['wins'], stats['total'],
-                total_wins, len(trades)
-            )
-            
-            if abs(diff) >= 10 and p_value < 0.1:
-                if diff > 0:
-                    suggestions.append({
-                        'type': 'prompt',
-                        'category': 'phrase_emphasis',
-                        'title': f'Emphasize "{phrase.upper()}" in Analysis',
-                        'explanation': f'Signals mentioning "{phrase}" have a {phrase_rate:.0f}% win rate vs {overall_rate:.0f}% overall ({stats["total"]} trades). This {diff:+.0f}% difference suggests this pattern is a strong predictor of success.',
-                        'action': f'Add emphasis to AI prompt: "Pay special attention to {phrase} setups as they show strong historical performance."',
-                        'projected_impact': f'+{diff:.0f}% win rate when present',
-                        'confidence': min(stats['total'] / 20, 1.0),
-                        'sample_size': stats['total'],
-                        'p_value': p_value,
-                        'data': {
-                            'phrase': phrase,
-                            'phrase_win_rate': phrase_rate,
-                            'overall_win_rate': overall_rate,
-                            'occurrences': stats['total']
-                        }
-                    })
-                else:
-                    suggestions.append({
-                        'type': 'prompt',
-                        'category': 'phrase_caution',
-                        'title': f'Add Caution for "{phrase.upper()}" Setups',
-                        'explanation': f'Signals mentioning "{phrase}" have only a {phrase_rate:.0f}% win rate vs {overall_rate:.0f}% overall ({stats["total"]} trades). This pattern may be leading to lower quality signals.',
-                        'action': f'Add caution to AI prompt: "Be more selective with {phrase} setups - require additional confluence."',
-                        'projected_impact': f'Filtering these could improve overall win rate',
-                        'confidence': min(stats['total'] / 20, 1.0),
-                        'sample_size': stats['total'],
-                        'p_value': p_value,
-                        'data': {
-                            'phrase': phrase,
-                            'phrase_win_rate': phrase_rate,
-                            'overall_win_rate': overall_rate,
-                            'occurrences': stats['total']
-                        }
-                    })
+            if diff > 0:
+                suggestions.append({
+                    'type': 'prompt',
+                    'category': 'phrase_emphasis',
+                    'title': f'Emphasize "{phrase.upper()}" in Analysis',
+                    'explanation': f'Signals mentioning "{phrase}" have a {phrase_rate:.0f}% win rate vs {overall_rate:.0f}% overall ({totals[i]} trades). This {diff:+.0f}% difference suggests this pattern is a strong predictor of success.',
+                    'action': f'Add emphasis to AI prompt: "Pay special attention to {phrase} setups as they show strong historical performance."',
+                    'projected_impact': f'+{diff:.0f}% win rate when present',
+                    'confidence': min(totals[i] / 20, 1.0),
+                    'sample_size': totals[i],
+                    'p_value': p_value,
+                    'data': {
+                        'phrase': phrase,
+                        'phrase_win_rate': phrase_rate,
+                        'overall_win_rate': overall_rate,
+                        'occurrences': totals[i]
+                    }
+                })
+            else:
+                suggestions.append({
+                    'type': 'prompt',
+                    'category': 'phrase_caution',
+                    'title': f'Add Caution for "{phrase.upper()}" Setups',
+                    'explanation': f'Signals mentioning "{phrase}" have only a {phrase_rate:.0f}% win rate vs {overall_rate:.0f}% overall ({totals[i]} trades). This pattern may be leading to lower quality signals.',
+                    'action': f'Add caution to AI prompt: "Be more selective with {phrase} setups - require additional confluence."',
+                    'projected_impact': f'Filtering these could improve overall win rate',
+                    'confidence': min(totals[i] / 20, 1.0),
+                    'sample_size': totals[i],
+                    'p_value': p_value,
+                    'data': {
+                        'phrase': phrase,
+                        'phrase_win_rate': phrase_rate,
+                        'overall_win_rate': overall_rate,
+                        'occurrences': totals[i]
+                    }
+                })
         
         return suggestions
 
@@ -177,106 +363,112 @@ class SmartFilterOptimizer:
     Analyzes filter combinations to find optimal settings
     """
     
-    def analyze(self, trades):
+    CONFIDENCE_THRESHOLDS = [75, 80, 85, 90]
+    RR_THRESHOLDS = [2.0, 2.5, 3.0]
+    
+    def analyze(self, bundle):
         """Test various filter combinations"""
-        if not trades:
+        if not bundle.total:
             return []
         
         suggestions = []
         
         # Current baseline
-        total_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        baseline_rate = total_wins / len(trades) * 100
-        baseline_pnl = sum(t.get('pnl_ticks') or 0 for t in trades)
+        baseline_rate = bundle.win_rate
         
         # Test confidence thresholds
-        confidence_results = self._test_confidence_thresholds(trades, baseline_rate)
+        confidence_results = self._test_confidence_thresholds(bundle, bundle.aggregates['confidence'], baseline_rate)
         suggestions.extend(confidence_results)
         
         # Test R:R combinations
-        rr_results = self._test_rr_thresholds(trades, baseline_rate)
+        rr_results = self._test_rr_thresholds(bundle, baseline_rate)
         suggestions.extend(rr_results)
         
         # Test combination filters
-        combo_results = self._test_combinations(trades, baseline_rate)
+        combo_results = self._test_combinations(bundle, bundle.aggregates['direction'], baseline_rate)
         suggestions.extend(combo_results)
         
         return suggestions
     
-    def _test_confidence_thresholds(self, trades, baseline_rate):
-        """Test different confidence thresholds"""
+    def _test_confidence_thresholds(self, bundle, confidence_stats, baseline_rate):
+        """Test different confidence thresholds (thresholds line up with the 5-pt buckets)"""
         suggestions = []
+        thresholds = self.CONFIDENCE_THRESHOLDS
+        
+        # Trade/win counts at or above each bucket (suffix sums over the sorted
+        # buckets, plus a trailing zero) - one searchsorted reads off every threshold
+        known = confidence_stats.known()
+        buckets = [confidence_stats.keys[i] for i in known]
+        totals_above = np.zeros(len(buckets) + 1, dtype=np.int64)
+        wins_above = np.zeros(len(buckets) + 1, dtype=np.int64)
+        totals_above[:-1] = np.cumsum(confidence_stats.totals[known][::-1])[::-1]
+        wins_above[:-1] = np.cumsum(confidence_stats.wins[known][::-1])[::-1]
+        
+        positions = np.searchsorted(buckets, thresholds)
+        # Only thresholds with enough trades and a 5+ point gain need a significance test
+        tested = [
+            (threshold, wins, filtered_total)
+            for threshold, wins, filtered_total in zip(
+                thresholds, wins_above[positions].tolist(), totals_above[positions].tolist())
+            if filtered_total >= 10 and wins / filtered_total * 100 - baseline_rate >= 5
+        ]
         
-        for threshold in [75, 80, 85, 90]:
-            filtered = [t for t in trades if t.get('confidence', 0) >= threshold]
-            
-            if len(filtered) < 10:
-                continue
-            
-            wins = sum(1 for t in filtered if t['outcome'] == 'win')
-            rate = wins / len(filtered) * 100
+        p_values = calculate_significance_batch(
+            [wins for _, wins, _ in tested], [total for _, _, total in tested],
+            bundle.wins, bundle.total)
+        
+        survivors = [(row, p_value) for row, p_value in zip(tested, p_values) if p_value < 0.1]
+        
+        for (threshold, wins, filtered_total), p_value in survivors:
+            rate = wins / filtered_total * 100
             diff = rate - baseline_rate
             
-            p_value = calculate_significance(wins, len(filtered), 
-                sum(1 for t in trades if t['outcome'] == 'win'), len(trades))
+            # Calculate trade reduction
+            reduction = (1 - filtered_total / bundle.total) * 100
             
-            if diff >= 5 and p_value < 0.1:
-                # Calculate trade reduction
-                reduction = (1 - len(filtered) / len(trades)) * 100
-                
-                suggestions.append({
-                    'type': 'filter',
-                    'category': 'confidence_threshold',
-                    'title': f'Increase Confidence Threshold to {threshold}%',
-                    'explanation': f'Signals with {threshold}%+ confidence have a {rate:.0f}% win rate vs {baseline_rate:.0f}% baseline. You would take {len(filtered)} trades instead of {len(trades)} ({reduction:.0f}% fewer), but with better quality.',
-                    'action': f'Update min_confidence setting from current to {threshold}',
-                    'projected_impact': f'+{diff:.0f}% win rate, -{reduction:.0f}% trade volume',
-                    'confidence': min(len(filtered) / 30, 1.0),
-                    'sample_size': len(filtered),
-                    'p_value': p_value,
-                    'data': {
-                        'threshold': threshold,
-                        'filtered_win_rate': rate,
-                        'baseline_win_rate': baseline_rate,
-                        'trades_filtered': len(filtered),
-                        'trades_total': len(trades)
-                    }
-                })
+            suggestions.append({
+                'type': 'filter',
+                'category': 'confidence_threshold',
+                'title': f'Increase Confidence Threshold to {threshold}%',
+                'explanation': f'Signals with {threshold}%+ confidence have a {rate:.0f}% win rate vs {baseline_rate:.0f}% baseline. You would take {filtered_total} trades instead of {bundle.total} ({reduction:.0f}% fewer), but with better quality.',
+                'action': f'Update min_confidence setting from current to {threshold}',
+                'projected_impact': f'+{diff:.0f}% win rate, -{reduction:.0f}% trade volume',
+                'confidence': min(filtered_total / 30, 1.0),
+                'sample_size': filtered_total,
+                'p_value': p_value,
+                'data': {
+                    'threshold': threshold,
+                    'filtered_win_rate': rate,
+                    'baseline_win_rate': baseline_rate,
+                    'trades_filtered': filtered_total,
+                    'trades_total': bundle.total
+                }
+            })
         
         return suggestions
     
-    def _test_rr_thresholds(self, trades, baseline_rate):
+    def _test_rr_thresholds(self, bundle, baseline_rate):
         """Test different R:R thresholds"""
         suggestions = []
         
-        def calc_rr(trade):
-            try:
-                entry = trade.get('entry_price')
-                stop = trade.get('stop_price')
-                target = trade.get('target_price')
-                if not all([entry, stop, target]):
-                    return None
-                risk = abs(float(entry) - float(stop))
-                reward = abs(float(target) - float(entry))
-                return reward / risk if risk > 0 else None
-            except:
-                return None
-        
-        for threshold in [2.0, 2.5, 3.0]:
-            filtered = [t for t in trades if (calc_rr(t) or 0) >= threshold]
+        for threshold in self.RR_THRESHOLDS:
+            mask = bundle.rr >= threshold     # NaN (no valid R:R) never passes
+            filtered_total = int(mask.sum())
             
-            if len(filtered) < 10:
+            if filtered_total < 10:
                 continue
             
-            wins = sum(1 for t in filtered if t['outcome'] == 'win')
-            rate = wins / len(filtered) * 100
+            wins = int((bundle.win_mask & mask).sum())
+            rate = wins / filtered_total * 100
             diff = rate - baseline_rate
+            if diff < 5:
+                continue
             
-            p_value = calculate_significance(wins, len(filtered),
-                sum(1 for t in trades if t['outcome'] == 'win'), len(trades))
+            p_value = calculate_significance(wins, filtered_total,
+                bundle.wins, bundle.total)
             
-            if diff >= 5 and p_value < 0.1:
-                reduction = (1 - len(filtered) / len(trades)) * 100
+            if p_value < 0.1:
+                reduction = (1 - filtered_total / bundle.total) * 100
                 
                 suggestions.append({
                     'type': 'filter',
@@ -285,8 +477,8 @@ class SmartFilterOptimizer:
                     'explanation': f'Signals with {threshold}:1+ R:R have a {rate:.0f}% win rate vs {baseline_rate:.0f}% baseline. Higher R:R setups are performing better in your trading.',
                     'action': f'Update min_risk_reward setting to {threshold}',
                     'projected_impact': f'+{diff:.0f}% win rate, -{reduction:.0f}% trade volume',
-                    'confidence': min(len(filtered) / 30, 1.0),
-                    'sample_size': len(filtered),
+                    'confidence': min(filtered_total / 30, 1.0),
+                    'sample_size': filtered_total,
                     'p_value': p_value,
                     'data': {
                         'threshold': threshold,
@@ -297,25 +489,26 @@ class SmartFilterOptimizer:
         
         return suggestions
     
-    def _test_combinations(self, trades, baseline_rate):
+    def _test_combinations(self, bundle, direction_stats, baseline_rate):
         """Test combination filters"""
         suggestions = []
         
         # Test confidence + direction combinations
         for direction in ['long', 'short']:
-            dir_trades = [t for t in trades if t.get('direction') == direction]
-            if len(dir_trades) < 15:
+            i = direction_stats.index(direction)
+            if i is None or direction_stats.totals[i] < 15:
                 continue
             
-            dir_wins = sum(1 for t in dir_trades if t['outcome'] == 'win')
-            dir_rate = dir_wins / len(dir_trades) * 100
+            dir_wins, dir_total = int(direction_stats.wins[i]), int(direction_stats.totals[i])
+            dir_rate = dir_wins / dir_total * 100
             diff = dir_rate - baseline_rate
             
-            if abs(diff) >= 10:
-                p_value = calculate_significance(dir_wins, len(dir_trades),
-                    sum(1 for t in trades if t['outcome'] == 'win'), len(trades))
+            # Only a weak direction gets a suggestion
+            if diff < -10:
+                p_value = calculate_significance(dir_wins, dir_total,
+                    bundle.wins, bundle.total)
                 
-                if diff < -10 and p_value < 0.1:
+                if p_value < 0.1:
                     opposite = 'short' if direction == 'long' else 'long'
                     suggestions.append({
                         'type': 'filter',
@@ -324,8 +517,8 @@ class SmartFilterOptimizer:
                         'explanation': f'Your {direction} trades have a {dir_rate:.0f}% win rate vs {baseline_rate:.0f}% overall. {opposite.capitalize()} trades are significantly outperforming. Consider focusing on {opposite} setups until {direction} performance improves.',
                         'action': f'Add direction filter to prefer {opposite} trades',
                         'projected_impact': f'Could improve win rate by focusing on stronger direction',
-                        'confidence': min(len(dir_trades) / 30, 1.0),
-                        'sample_size': len(dir_trades),
+                        'confidence': min(dir_total / 30, 1.0),
+                        'sample_size': dir_total,
                         'p_value': p_value,
                         'data': {
                             'weak_direction': direction,
@@ -342,59 +535,56 @@ class PatternRecognizer:
     Identifies winning patterns and setup types
     """
     
-    def analyze(self, trades):
+    def analyze(self, bundle):
         """Analyze patterns in winning vs losing trades"""
-        if not trades:
+        if not bundle.total:
             return []
         
         suggestions = []
         
         # Analyze by entry type
-        entry_suggestions = self._analyze_entry_types(trades)
+        entry_suggestions = self._analyze_entry_types(bundle, bundle.aggregates['entry_type'])
         suggestions.extend(entry_suggestions)
         
         # Analyze by ticker
-        ticker_suggestions = self._analyze_tickers(trades)
+        ticker_suggestions = self._analyze_tickers(bundle, bundle.aggregates['ticker'])
         suggestions.extend(ticker_suggestions)
         
         return suggestions
     
-    def _analyze_entry_types(self, trades):
+    def _analyze_entry_types(self, bundle, entry_stats):
         """Analyze performance by entry type"""
         suggestions = []
-        entry_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'total': 0})
+        baseline_rate = bundle.win_rate
         
-        for trade in trades:
-            entry_type = trade.get('entry_type', 'UNKNOWN')
-            entry_stats[entry_type]['total'] += 1
-            if trade['outcome'] == 'win':
-                entry_stats[entry_type]['wins'] += 1
-            else:
-                entry_stats[entry_type]['losses'] += 1
+        entry_types, totals, wins = entry_stats.keys, entry_stats.totals, entry_stats.wins
+        rates = wins / np.maximum(totals, 1) * 100
+        diffs = rates - baseline_rate
         
-        baseline_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        baseline_rate = baseline_wins / len(trades) * 100
+        known = np.array([entry_type != 'UNKNOWN' for entry_type in entry_types], dtype=bool)
+        # Only entry types 10+ points off the baseline get a suggestion -
+        # significance is only checked for those
+        candidates = np.flatnonzero((totals >= 10) & known & (np.abs(diffs) >= 10))
+        p_values = np.ones(len(entry_types))
+        p_values[candidates] = calculate_significance_batch(
+            wins[candidates].tolist(), totals[candidates].tolist(), bundle.wins, bundle.total)
         
-        for entry_type, stats in entry_stats.items():
-            if stats['total'] < 10 or entry_type == 'UNKNOWN':
-                continue
-            
-            rate = stats['wins'] / stats['total'] * 100
-            diff = rate - baseline_rate
-            
-            p_value = calculate_significance(stats['wins'], stats['total'],
-                baseline_wins, len(trades))
+        survivors = candidates[p_values[candidates] < 0.1]
+        
+        for i in survivors.tolist():
+            entry_type = entry_types[i]
+            rate, diff, total, p_value = float(rates[i]), float(diffs[i]), int(totals[i]), float(p_values[i])
             
-            if diff >= 10 and p_value < 0.1:
+            if diff >= 10:
                 suggestions.append({
                     'type': 'pattern',
                     'category': 'entry_type',
                     'title': f'Prioritize {entry_type} Entries',
-                    'explanation': f'{entry_type} entries have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({stats["total"]} trades). This entry style is working well for you.',
+                    'explanation': f'{entry_type} entries have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({total} trades). This entry style is working well for you.',
                     'action': f'Add preference in AI prompt for {entry_type} setups',
                     'projected_impact': f'+{diff:.0f}% win rate when using this entry type',
-                    'confidence': min(stats['total'] / 25, 1.0),
-                    'sample_size': stats['total'],
+                    'confidence': min(total / 25, 1.0),
+                    'sample_size': total,
                     'p_value': p_value,
                     'data': {
                         'entry_type': entry_type,
@@ -402,7 +592,7 @@ class PatternRecognizer:
                         'baseline_rate': baseline_rate
                     }
                 })
-            elif diff <= -10 and p_value < 0.1:
+            else:
                 suggestions.append({
                     'type': 'pattern',
                     'category': 'entry_type_avoid',
@@ -410,8 +600,8 @@ class PatternRecognizer:
                     'explanation': f'{entry_type} entries have only a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall. These setups are underperforming.',
                     'action': f'Add caution in AI prompt for {entry_type} entries - require extra confirmation',
                     'projected_impact': f'Avoiding these could improve overall performance',
-                    'confidence': min(stats['total'] / 25, 1.0),
-                    'sample_size': stats['total'],
+                    'confidence': min(total / 25, 1.0),
+                    'sample_size': total,
                     'p_value': p_value,
                     'data': {
                         'entry_type': entry_type,
@@ -422,51 +612,45 @@ class PatternRecognizer:
         
         return suggestions
     
-    def _analyze_tickers(self, trades):
+    def _analyze_tickers(self, bundle, ticker_stats):
         """Analyze performance by ticker"""
         suggestions = []
-        ticker_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'total': 0, 'pnl': 0})
-        
-        for trade in trades:
-            ticker = trade.get('ticker', 'UNKNOWN')
-            ticker_stats[ticker]['total'] += 1
-            ticker_stats[ticker]['pnl'] += trade.get('pnl_ticks') or 0
-            if trade['outcome'] == 'win':
-                ticker_stats[ticker]['wins'] += 1
-            else:
-                ticker_stats[ticker]['losses'] += 1
+        baseline_rate = bundle.win_rate
         
-        baseline_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        baseline_rate = baseline_wins / len(trades) * 100
+        tickers, totals, wins = ticker_stats.keys, ticker_stats.totals, ticker_stats.wins
+        rates = wins / np.maximum(totals, 1) * 100
+        diffs = rates - baseline_rate
         
-        for ticker, stats in ticker_stats.items():
-            if stats['total'] < 10:
-                continue
-            
-            rate = stats['wins'] / stats['total'] * 100
-            diff = rate - baseline_rate
-            
-            p_value = calculate_significance(stats['wins'], stats['total'],
-                baseline_wins, len(trades))
+        # Only tickers 15+ points under the baseline get a suggestion
+        candidates = np.flatnonzero((totals >= 10) & (diffs <= -15))
+        p_values = np.ones(len(tickers))
+        p_values[candidates] = calculate_significance_batch(
+            wins[candidates].tolist(), totals[candidates].tolist(), bundle.wins, bundle.total)
+        
+        survivors = candidates[p_values[candidates] < 0.1]
+        
+        for i in survivors.tolist():
+            ticker = tickers[i]
+            rate, total, p_value = float(rates[i]), int(totals[i]), float(p_values[i])
+            pnl = float(ticker_stats.pnl[i])
             
-            if diff <= -15 and p_value < 0.1:
-                suggestions.append({
-                    'type': 'pattern',
-                    'category': 'ticker_performance',
-                    'title': f'Review {ticker} Trading',
-                    'explanation': f'{ticker} has a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall with {stats["pnl"]:+.1f} ticks P&L. Consider reducing exposure or requiring higher confidence for this ticker.',
-                    'action': f'Add ticker-specific filter: require 85%+ confidence for {ticker}',
-                    'projected_impact': f'Improved {ticker} trade selection',
-                    'confidence': min(stats['total'] / 25, 1.0),
-                    'sample_size': stats['total'],
-                    'p_value': p_value,
-                    'data': {
-                        'ticker': ticker,
-                        'win_rate': rate,
-                        'baseline_rate': baseline_rate,
-                        'total_pnl': stats['pnl']
-                    }
-                })
+            suggestions.append({
+                'type': 'pattern',
+                'category': 'ticker_performance',
+                'title': f'Review {ticker} Trading',
+                'explanation': f'{ticker} has a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall with {pnl:+.1f} ticks P&L. Consider reducing exposure or requiring higher confidence for this ticker.',
+                'action': f'Add ticker-specific filter: require 85%+ confidence for {ticker}',
+                'projected_impact': f'Improved {ticker} trade selection',
+                'confidence': min(total / 25, 1.0),
+                'sample_size': total,
+                'p_value': p_value,
+                'data': {
+                    'ticker': ticker,
+                    'win_rate': rate,
+                    'baseline_rate': baseline_rate,
+                    'total_pnl': pnl
+                }
+            })
         
         return suggestions
 
@@ -476,174 +660,120 @@ class TimeOptimizer:
     Identifies best and worst trading times
     """
     
-    def analyze(self, trades):
+    def analyze(self, bundle):
         """Analyze performance by time of day and day of week"""
-        if not trades:
+        if not bundle.total:
             return []
         
         suggestions = []
         
         # Analyze by hour
-        hour_suggestions = self._analyze_hours(trades)
+        hour_suggestions = self._analyze_hours(bundle, bundle.aggregates['hour'])
         suggestions.extend(hour_suggestions)
         
         # Analyze by day of week
-        day_suggestions = self._analyze_days(trades)
+        day_suggestions = self._analyze_days(bundle, bundle.aggregates['weekday'])
         suggestions.extend(day_suggestions)
         
         return suggestions
     
-    def _analyze_hours(self, trades):
+    def _analyze_hours(self, bundle, hour_stats):
         """Analyze performance by hour"""
         suggestions = []
-        hour_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'total': 0})
         
-        for trade in trades:
-            try:
-                timestamp = trade.get('timestamp', '')
-                hour = int(timestamp.split(' ')[1].split(':')[0])
-                hour_stats[hour]['total'] += 1
-                if trade['outcome'] == 'win':
-                    hour_stats[hour]['wins'] += 1
-                else:
-                    hour_stats[hour]['losses'] += 1
-            except:
-                continue
-        
-        baseline_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        baseline_rate = baseline_wins / len(trades) * 100
-        
-        # Find worst hours
-        worst_hours = []
-        for hour, stats in hour_stats.items():
-            if stats['total'] < 5:
-                continue
-            
-            rate = stats['wins'] / stats['total'] * 100
-            diff = rate - baseline_rate
-            
-            if diff <= -15:
-                p_value = calculate_significance(stats['wins'], stats['total'],
-                    baseline_wins, len(trades))
-                if p_value < 0.15:
-                    worst_hours.append({
-                        'hour': hour,
-                        'rate': rate,
-                        'diff': diff,
-                        'total': stats['total'],
-                        'p_value': p_value
-                    })
-        
-        if worst_hours:
-            worst_hours.sort(key=lambda x: x['rate'])
-            worst = worst_hours[0]
-            hour_label = f"{worst['hour']:02d}:00-{worst['hour']:02d}:59"
+        baseline_rate = bundle.win_rate
+        
+        totals, wins = hour_stats.dense(24)
+        rates = wins / np.maximum(totals, 1) * 100
+        diffs = rates - baseline_rate
+        
+        # Significance only matters for hours 15+ points off the baseline -
+        # test all of those (worst and best) in one batch
+        candidates = np.flatnonzero((totals >= 5) & (np.abs(diffs) >= 15))
+        p_values = np.ones(24)
+        p_values[candidates] = calculate_significance_batch(
+            wins[candidates].tolist(), totals[candidates].tolist(), bundle.wins, bundle.total)
+        significant = (totals >= 5) & (p_values < 0.15)
+        
+        # Find worst hour
+        worst_hours = np.flatnonzero(significant & (diffs <= -15))
+        if len(worst_hours):
+            hour = int(worst_hours[np.argmin(rates[worst_hours])])
+            rate, diff, total = float(rates[hour]), float(diffs[hour]), int(totals[hour])
+            hour_label = f"{hour:02d}:00-{hour:02d}:59"
             
             suggestions.append({
                 'type': 'timing',
                 'category': 'avoid_hour',
                 'title': f'Avoid Trading {hour_label}',
-                'explanation': f'Your signals during {hour_label} have a {worst["rate"]:.0f}% win rate vs {baseline_rate:.0f}% overall ({worst["total"]} trades). This hour consistently underperforms.',
-                'action': f'Add time filter to skip signals between {worst["hour"]:02d}:00 and {worst["hour"]:02d}:59',
-                'projected_impact': f'Avoiding this hour could improve win rate by ~{abs(worst["diff"]):.0f}%',
-                'confidence': min(worst['total'] / 15, 1.0),
-                'sample_size': worst['total'],
-                'p_value': worst['p_value'],
+                'explanation': f'Your signals during {hour_label} have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({total} trades). This hour consistently underperforms.',
+                'action': f'Add time filter to skip signals between {hour:02d}:00 and {hour:02d}:59',
+                'projected_impact': f'Avoiding this hour could improve win rate by ~{abs(diff):.0f}%',
+                'confidence': min(total / 15, 1.0),
+                'sample_size': total,
+                'p_value': float(p_values[hour]),
                 'data': {
-                    'hour': worst['hour'],
-                    'hour_win_rate': worst['rate'],
+                    'hour': hour,
+                    'hour_win_rate': rate,
                     'baseline_rate': baseline_rate
                 }
             })
         
-        # Find best hours
-        best_hours = []
-        for hour, stats in hour_stats.items():
-            if stats['total'] < 5:
-                continue
-            
-            rate = stats['wins'] / stats['total'] * 100
-            diff = rate - baseline_rate
-            
-            if diff >= 15:
-                p_value = calculate_significance(stats['wins'], stats['total'],
-                    baseline_wins, len(trades))
-                if p_value < 0.15:
-                    best_hours.append({
-                        'hour': hour,
-                        'rate': rate,
-                        'diff': diff,
-                        'total': stats['total'],
-                        'p_value': p_value
-                    })
-        
-        if best_hours:
-            best_hours.sort(key=lambda x: x['rate'], reverse=True)
-            best = best_hours[0]
-            hour_label = f"{best['hour']:02d}:00-{best['hour']:02d}:59"
+        # Find best hour
+        best_hours = np.flatnonzero(significant & (diffs >= 15))
+        if len(best_hours):
+            hour = int(best_hours[np.argmax(rates[best_hours])])
+            rate, diff, total = float(rates[hour]), float(diffs[hour]), int(totals[hour])
+            hour_label = f"{hour:02d}:00-{hour:02d}:59"
             
             suggestions.append({
                 'type': 'timing',
                 'category': 'best_hour',
                 'title': f'Focus on {hour_label} Trading Window',
-                'explanation': f'Your signals during {hour_label} have a {best["rate"]:.0f}% win rate vs {baseline_rate:.0f}% overall ({best["total"]} trades). This is your strongest trading hour.',
+                'explanation': f'Your signals during {hour_label} have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({total} trades). This is your strongest trading hour.',
                 'action': f'Consider increasing position size or lowering confidence threshold during {hour_label}',
-                'projected_impact': f'This window shows {best["diff"]:+.0f}% better performance',
-                'confidence': min(best['total'] / 15, 1.0),
-                'sample_size': best['total'],
-                'p_value': best['p_value'],
+                'projected_impact': f'This window shows {diff:+.0f}% better performance',
+                'confidence': min(total / 15, 1.0),
+                'sample_size': total,
+                'p_value': float(p_values[hour]),
                 'data': {
-                    'hour': best['hour'],
-                    'hour_win_rate': best['rate'],
+                    'hour': hour,
+                    'hour_win_rate': rate,
                     'baseline_rate': baseline_rate
                 }
             })
         
         return suggestions
     
-    def _analyze_days(self, trades):
+    def _analyze_days(self, bundle, day_stats):
         """Analyze performance by day of week"""
         suggestions = []
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_stats = defaultdict(lambda: {'wins': 0, 'losses': 0, 'total': 0})
         
-        for trade in trades:
-            try:
-                timestamp = trade.get('timestamp', '')
-                date_part = timestamp.split(' ')[0]
-                dt = datetime.strptime(date_part, '%Y-%m-%d')
-                day = dt.weekday()
-                day_stats[day]['total'] += 1
-                if trade['outcome'] == 'win':
-                    day_stats[day]['wins'] += 1
-                else:
-                    day_stats[day]['losses'] += 1
-            except:
-                continue
+        baseline_rate = bundle.win_rate
         
-        baseline_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        baseline_rate = baseline_wins / len(trades) * 100
+        totals, wins = day_stats.dense(7)
+        rates = wins / np.maximum(totals, 1) * 100
+        diffs = rates - baseline_rate
         
-        for day, stats in day_stats.items():
-            if stats['total'] < 8:
-                continue
-            
-            rate = stats['wins'] / stats['total'] * 100
-            diff = rate - baseline_rate
-            
-            p_value = calculate_significance(stats['wins'], stats['total'],
-                baseline_wins, len(trades))
-            
-            if diff <= -15 and p_value < 0.15:
+        # Only days 15+ points under the baseline get a suggestion
+        candidates = np.flatnonzero((totals >= 8) & (diffs <= -15))
+        p_values = calculate_significance_batch(
+            wins[candidates].tolist(), totals[candidates].tolist(), bundle.wins, bundle.total)
+        
+        for day, rate, diff, total, p_value in zip(
+                candidates.tolist(), rates[candidates].tolist(), diffs[candidates].tolist(),
+                totals[candidates].tolist(), p_values):
+            if p_value < 0.15:
                 suggestions.append({
                     'type': 'timing',
                     'category': 'avoid_day',
                     'title': f'Reduce {day_names[day]} Trading',
-                    'explanation': f'{day_names[day]} trades have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({stats["total"]} trades). Consider being more selective on this day.',
+                    'explanation': f'{day_names[day]} trades have a {rate:.0f}% win rate vs {baseline_rate:.0f}% overall ({total} trades). Consider being more selective on this day.',
                     'action': f'Increase confidence requirement to 85%+ on {day_names[day]}s',
                     'projected_impact': f'Better {day_names[day]} trade selection',
-                    'confidence': min(stats['total'] / 20, 1.0),
-                    'sample_size': stats['total'],
+                    'confidence': min(total / 20, 1.0),
+                    'sample_size': total,
                     'p_value': p_value,
                     'data': {
                         'day': day,
@@ -663,19 +793,19 @@ class StrategyCoach:
     Main AI Strategy Coach that coordinates all analyzers
     """
     
-    def __init__(self):
-        self.analyzers = [
-            PromptEvolutionAnalyzer(),
-            SmartFilterOptimizer(),
-            PatternRecognizer(),
-            TimeOptimizer()
-        ]
+    # Analyzers keep no per-run state - one shared set serves every request
+    analyzers = (
+        PromptEvolutionAnalyzer(),
+        SmartFilterOptimizer(),
+        PatternRecognizer(),
+        TimeOptimizer()
+    )
     
     def run_full_analysis(self, min_trades=20):
         """
         Run all analyzers and return prioritized suggestions
         """
-        trades, error = get_trade_data(min_trades)
+        bundle, error = get_trade_data(min_trades)
         
         if error:
             return {
@@ -688,7 +818,7 @@ class StrategyCoach:
         
         for analyzer in self.analyzers:
             try:
-                suggestions = analyzer.analyze(trades)
+                suggestions = analyzer.analyze(bundle)
                 all_suggestions.extend(suggestions)
             except Exception as e:
                 print(f"⚠️  Analyzer error: {e}")
@@ -699,15 +829,11 @@ class StrategyCoach:
             x.get('p_value', 1)
         ))
         
-        # Calculate summary stats
-        total_trades = len(trades)
-        total_wins = sum(1 for t in trades if t['outcome'] == 'win')
-        
         return {
             'status': 'success',
             'summary': {
-                'total_trades': total_trades,
-                'win_rate': round(total_wins / total_trades * 100, 1),
+                'total_trades': bundle.total,
+                'win_rate': round(bundle.win_rate, 1),
                 'suggestions_count': len(all_suggestions),
                 'analyzers_run': len(self.analyzers),
                 'analysis_time': datetime.now().isoformat()
@@ -719,20 +845,18 @@ class StrategyCoach:
         """
         Get quick insights without full suggestions
         """
-        trades, error = get_trade_data(min_trades)
+        bundle, error = get_trade_data(min_trades)
         
         if error:
             return {'status': 'insufficient_data', 'message': error}
         
-        total = len(trades)
-        wins = sum(1 for t in trades if t['outcome'] == 'win')
-        
-        # Recent trend (last 20 vs previous)
-        recent = trades[:20]
-        previous = trades[20:40] if len(trades) >= 40 else []
+        total = bundle.total
+        wins = bundle.wins
+        win_mask = bundle.win_mask
         
-        recent_rate = sum(1 for t in recent if t['outcome'] == 'win') / len(recent) * 100
-        prev_rate = sum(1 for t in previous if t['outcome'] == 'win') / len(previous) * 100 if previous else None
+        # Recent trend (last 20 vs previous) - rows are newest first
+        recent_rate = float(win_mask[:20].mean()) * 100
+        prev_rate = float(win_mask[20:40].mean()) * 100 if total >= 40 else None
         
         trend = 'improving' if prev_rate and recent_rate > prev_rate + 5 else \
                 'declining' if prev_rate and recent_rate < prev_rate - 5 else 'stable'
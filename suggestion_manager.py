@@ -6,19 +6,51 @@ Measures actual vs projected impact of approved changes.
 
 import json
 import os
+import re
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from hashlib import blake2b
 from threading import Lock
 
 # Import shared database connection
-from database import get_connection
+from database import get_connection, read_query
+from settings_store import SETTINGS_FILE, write_settings
 
-# State files
+# Fast JSON encoding for the state file (optional - falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# State file
 SUGGESTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'coach_suggestions.json')
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
 
 # Thread safety
 suggestion_lock = Lock()
 
+# Data fields that drive settings changes get their own typed columns
+# (data_<field>) - the JSON data column keeps the full payload for display
+DATA_COLUMNS = {
+    'hour': 'INTEGER',
+    'threshold': 'NUMERIC',     # Keeps 85 an int and 2.5 a float
+    'phrase': 'TEXT',
+    'weak_direction': 'TEXT',
+}
+
+# Last state read/written, keyed by the file's mtime - re-read only when
+# something else has changed the file
+_state_cache = {'mtime': None, 'state': None}
+
+# Baseline metrics are read on approve and again on impact checks -
+# reuse them for a few seconds
+METRICS_CACHE_SECONDS = 10
+_metrics_cache = {'checked_at': 0, 'metrics': None}
+
+# First signed number in a projected_impact string ("+12% win rate")
+PROJECTED_NUM_RE = re.compile(r'([+-]?\d+)')
+
 
 def init_suggestions_table():
     """Initialize suggestions tracking table"""
@@ -48,52 +80,196 @@ def init_suggestions_table():
             baseline_trades INTEGER,
             post_win_rate REAL,
             post_trades INTEGER,
-            actual_impact TEXT
+            actual_impact TEXT,
+            data_hour INTEGER,
+            data_threshold NUMERIC,
+            data_phrase TEXT,
+            data_weak_direction TEXT
         )
     ''')
     
+    # Add typed data columns to tables created before them
+    cursor.execute("PRAGMA table_info(coach_suggestions)")
+    columns = [col[1] for col in cursor.fetchall()]
+    for field, column_type in DATA_COLUMNS.items():
+        if f'data_{field}' not in columns:
+            cursor.execute(f'ALTER TABLE coach_suggestions ADD COLUMN data_{field} {column_type}')
+    
+    # The table is the source of truth for pending/approved/rejected lists
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_suggestion_status_reviewed
+        ON coach_suggestions(status, reviewed_at DESC)
+    ''')
+    
+    conn.commit()
+    conn.close()
+    
+    migrate_suggestion_lists()
+
+
+def migrate_suggestion_lists():
+    """
+    Move suggestion lists left in an older state file into the table
+    (the file used to hold full pending/approved/rejected lists)
+    """
+    state = load_suggestions_state()
+    if not any(key in state for key in ('pending', 'approved', 'rejected')):
+        return
+    legacy = [(s, key) for key in ('pending', 'approved', 'rejected')
+              for s in state.pop(key, None) or []]
+    
+    conn = get_connection()
+    cursor = conn.cursor()
+    for suggestion, status in legacy:
+        if not suggestion.get('suggestion_id'):
+            continue
+        suggestion.setdefault('status', status)
+        cursor.execute('''
+            INSERT OR REPLACE INTO coach_suggestions (
+                suggestion_id, type, category, title, explanation,
+                action, projected_impact, confidence, sample_size,
+                p_value, data, status, created_at, reviewed_at,
+                rejection_reason, applied_settings, baseline_win_rate,
+                baseline_trades, post_win_rate, post_trades, actual_impact
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            suggestion['suggestion_id'],
+            suggestion.get('type'),
+            suggestion.get('category'),
+            suggestion.get('title'),
+            suggestion.get('explanation'),
+            suggestion.get('action'),
+            suggestion.get('projected_impact'),
+            suggestion.get('confidence'),
+            suggestion.get('sample_size'),
+            suggestion.get('p_value'),
+            json.dumps(suggestion.get('data', {})),
+            suggestion['status'],
+            suggestion.get('created_at'),
+            suggestion.get('reviewed_at'),
+            suggestion.get('rejection_reason'),
+            json.dumps(suggestion.get('applied_settings', {})),
+            suggestion.get('baseline_win_rate'),
+            suggestion.get('baseline_trades'),
+            suggestion.get('post_win_rate'),
+            suggestion.get('post_trades'),
+            suggestion.get('actual_impact')
+        ))
     conn.commit()
     conn.close()
+    
+    save_suggestions_state(state)
+    print(f"✅ Migrated {len(legacy)} suggestions from state file to database")
 
 
 def load_suggestions_state():
-    """Load suggestions state from file"""
+    """
+    Load suggestion counters from file (last analysis time and weekly
+    change limit) - the suggestions themselves live in coach_suggestions
+    """
     default = {
-        'pending': [],
-        'approved': [],
-        'rejected': [],
         'last_analysis': None,
         'changes_this_week': 0,
         'week_start': None
     }
     try:
         if os.path.exists(SUGGESTIONS_FILE):
+            mtime = os.stat(SUGGESTIONS_FILE).st_mtime_ns
+            if _state_cache['mtime'] == mtime:
+                return dict(_state_cache['state'])
+            
             with open(SUGGESTIONS_FILE, 'r') as f:
                 state = json.load(f)
                 # Merge with defaults
                 for key in default:
                     if key not in state:
                         state[key] = default[key]
-                return state
+            _state_cache['mtime'] = mtime
+            _state_cache['state'] = state
+            return dict(state)
     except Exception as e:
         print(f"⚠️  Error loading suggestions state: {e}")
     return default
 
 
 def save_suggestions_state(state):
-    """Save suggestions state to file"""
+    """Save suggestion counters to file (written to a temp file and swapped in)"""
     try:
-        with open(SUGGESTIONS_FILE, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
+        tmp_file = SUGGESTIONS_FILE + '.tmp'
+        if ORJSON_AVAILABLE:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(state, default=str))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f, default=str)
+        os.replace(tmp_file, SUGGESTIONS_FILE)
+        _state_cache['mtime'] = os.stat(SUGGESTIONS_FILE).st_mtime_ns
+        _state_cache['state'] = dict(state)
     except Exception as e:
         print(f"⚠️  Error saving suggestions state: {e}")
 
 
+def suggestion_from_row(row):
+    """Suggestion dict from a coach_suggestions row (JSON columns decoded)"""
+    suggestion = dict(row)
+    del suggestion['id']
+    for key in ('data', 'applied_settings'):
+        suggestion[key] = json.loads(suggestion[key]) if suggestion[key] else {}
+    return suggestion
+
+
+def suggestion_data(suggestion):
+    """
+    Data fields for applying a suggestion - typed data_<field> columns,
+    falling back to the JSON payload for rows stored before they existed
+    """
+    data = dict(suggestion.get('data') or {})
+    for field in DATA_COLUMNS:
+        value = suggestion.get(f'data_{field}')
+        if value is not None:
+            data[field] = value
+    return data
+
+
+def fetch_suggestion(suggestion_id, status, cursor=None):
+    """
+    Get one suggestion with the given status (None if not found) - read
+    through `cursor` when given so it's part of the caller's transaction
+    """
+    sql = 'SELECT * FROM coach_suggestions WHERE suggestion_id = ? AND status = ?'
+    if cursor is None:
+        rows = read_query(sql, (suggestion_id, status))
+    else:
+        rows = cursor.execute(sql, (suggestion_id, status)).fetchall()
+    return suggestion_from_row(rows[0]) if rows else None
+
+
+@contextmanager
+def suggestion_transaction():
+    """
+    Write transaction for suggestion status changes - commits when the
+    block finishes, and always closes the connection (rolling back on
+    error) so the write lock is never left held
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        yield cursor
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def generate_suggestion_id(suggestion):
-    """Generate unique ID for a suggestion"""
-    import hashlib
+    """Generate unique ID for a suggestion (12 hex chars)"""
     content = f"{suggestion['type']}_{suggestion['category']}_{suggestion.get('title', '')}"
-    return hashlib.md5(content.encode()).hexdigest()[:12]
+    return blake2b(content.encode(), digest_size=6).hexdigest()
+
+
+def suggestion_key(suggestion):
+    """What makes two suggestions the same - the fields the ID is hashed from"""
+    return (suggestion['type'], suggestion['category'], suggestion.get('title', ''))
 
 
 def add_suggestions(suggestions):
@@ -103,45 +279,32 @@ def add_suggestions(suggestions):
     """
     with suggestion_lock:
         state = load_suggestions_state()
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Get existing suggestion IDs
-        existing_ids = set()
-        for s in state['pending']:
-            existing_ids.add(s.get('suggestion_id'))
-        for s in state['approved']:
-            existing_ids.add(s.get('suggestion_id'))
-        
-        # Also check recently rejected (within 7 days)
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        for s in state['rejected']:
-            if s.get('reviewed_at', '') > week_ago:
-                existing_ids.add(s.get('suggestion_id'))
-        
-        added = 0
-        for suggestion in suggestions:
-            suggestion_id = generate_suggestion_id(suggestion)
+        # One write transaction for the whole batch
+        with suggestion_transaction() as cursor:
+            # Get existing suggestions - pending, approved, and anything
+            # reviewed (rejected) within the last 7 days. Matched on content
+            # rather than ID so rows stored under older ID hashes still count
+            week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+            cursor.execute('''
+                SELECT type, category, title FROM coach_suggestions
+                WHERE status IN ('pending', 'approved') OR reviewed_at > ?
+            ''', (week_ago,))
+            existing = {tuple(row) for row in cursor.fetchall()}
+        
+            rows = []
+            for suggestion in suggestions:
+                key = suggestion_key(suggestion)
+                if key in existing:
+                    continue
+                existing.add(key)
             
-            if suggestion_id in existing_ids:
-                continue
+                suggestion_id = generate_suggestion_id(suggestion)
             
-            suggestion['suggestion_id'] = suggestion_id
-            suggestion['created_at'] = datetime.now().isoformat()
-            suggestion['status'] = 'pending'
+                suggestion['suggestion_id'] = suggestion_id
+                suggestion['created_at'] = datetime.now().isoformat()
+                suggestion['status'] = 'pending'
             
-            # Add to pending
-            state['pending'].append(suggestion)
-            
-            # Also store in database
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO coach_suggestions (
-                        suggestion_id, type, category, title, explanation,
-                        action, projected_impact, confidence, sample_size,
-                        p_value, data, status, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     suggestion_id,
                     suggestion.get('type'),
                     suggestion.get('category'),
@@ -154,14 +317,23 @@ def add_suggestions(suggestions):
                     suggestion.get('p_value'),
                     json.dumps(suggestion.get('data', {})),
                     'pending',
-                    suggestion['created_at']
+                    suggestion['created_at'],
+                    *(suggestion.get('data', {}).get(field) for field in DATA_COLUMNS)
                 ))
-                added += 1
-            except Exception as e:
-                print(f"⚠️  Error storing suggestion: {e}")
         
-        conn.commit()
-        conn.close()
+            added = 0
+            try:
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO coach_suggestions (
+                        suggestion_id, type, category, title, explanation,
+                        action, projected_impact, confidence, sample_size,
+                        p_value, data, status, created_at,
+                        data_hour, data_threshold, data_phrase, data_weak_direction
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                added = len(rows)
+            except Exception as e:
+                print(f"⚠️  Error storing suggestions: {e}")
         
         state['last_analysis'] = datetime.now().isoformat()
         save_suggestions_state(state)
@@ -172,23 +344,19 @@ def add_suggestions(suggestions):
 def get_pending_suggestions():
     """Get all pending suggestions"""
     with suggestion_lock:
-        state = load_suggestions_state()
         # Sort by confidence descending
-        pending = sorted(
-            state.get('pending', []),
-            key=lambda x: (-x.get('confidence', 0), x.get('p_value', 1))
-        )
-        return pending
+        rows = read_query('''
+            SELECT * FROM coach_suggestions
+            WHERE status = 'pending'
+            ORDER BY confidence DESC, p_value ASC
+        ''')
+        return [suggestion_from_row(row) for row in rows]
 
 
 def get_suggestion_by_id(suggestion_id):
     """Get a specific suggestion"""
     with suggestion_lock:
-        state = load_suggestions_state()
-        for s in state['pending']:
-            if s.get('suggestion_id') == suggestion_id:
-                return s
-        return None
+        return fetch_suggestion(suggestion_id, 'pending')
 
 
 def approve_suggestion(suggestion_id, apply_change=True):
@@ -198,6 +366,11 @@ def approve_suggestion(suggestion_id, apply_change=True):
     Returns dict with result and any applied changes
     """
     with suggestion_lock:
+        suggestion = fetch_suggestion(suggestion_id, 'pending')
+        
+        if not suggestion:
+            return {'status': 'error', 'message': 'Suggestion not found'}
+        
         state = load_suggestions_state()
         
         # Check weekly limit
@@ -212,16 +385,6 @@ def approve_suggestion(suggestion_id, apply_change=True):
             state['week_start'] = now.isoformat()
             state['changes_this_week'] = 0
         
-        # Find and remove from pending
-        suggestion = None
-        for i, s in enumerate(state['pending']):
-            if s.get('suggestion_id') == suggestion_id:
-                suggestion = state['pending'].pop(i)
-                break
-        
-        if not suggestion:
-            return {'status': 'error', 'message': 'Suggestion not found'}
-        
         # Record baseline metrics before change
         baseline = get_current_metrics()
         suggestion['baseline_win_rate'] = baseline['win_rate']
@@ -237,10 +400,11 @@ def approve_suggestion(suggestion_id, apply_change=True):
         # Move to approved
         suggestion['status'] = 'approved'
         suggestion['reviewed_at'] = now.isoformat()
-        state['approved'].append(suggestion)
         
-        # Update database
-        update_suggestion_status(suggestion_id, 'approved', suggestion)
+        # Update database (settings.json is already written - the write
+        # lock is only held for the status change)
+        with suggestion_transaction() as cursor:
+            update_suggestion_status(cursor, suggestion_id, 'approved', suggestion)
         
         save_suggestions_state(state)
         
@@ -256,15 +420,8 @@ def reject_suggestion(suggestion_id, reason=None):
     """
     Reject a suggestion with optional reason
     """
-    with suggestion_lock:
-        state = load_suggestions_state()
-        
-        # Find and remove from pending
-        suggestion = None
-        for i, s in enumerate(state['pending']):
-            if s.get('suggestion_id') == suggestion_id:
-                suggestion = state['pending'].pop(i)
-                break
+    with suggestion_lock, suggestion_transaction() as cursor:
+        suggestion = fetch_suggestion(suggestion_id, 'pending', cursor)
         
         if not suggestion:
             return {'status': 'error', 'message': 'Suggestion not found'}
@@ -273,12 +430,9 @@ def reject_suggestion(suggestion_id, reason=None):
         suggestion['status'] = 'rejected'
         suggestion['reviewed_at'] = datetime.now().isoformat()
         suggestion['rejection_reason'] = reason
-        state['rejected'].append(suggestion)
         
         # Update database
-        update_suggestion_status(suggestion_id, 'rejected', suggestion)
-        
-        save_suggestions_state(state)
+        update_suggestion_status(cursor, suggestion_id, 'rejected', suggestion)
         
         return {'status': 'success', 'suggestion': suggestion}
 
@@ -298,7 +452,7 @@ def apply_suggestion_change(suggestion):
         
         changes = {}
         category = suggestion.get('category', '')
-        data = suggestion.get('data', {})
+        data = suggestion_data(suggestion)
         
         # Apply based on category
         if category == 'confidence_threshold':
@@ -350,8 +504,7 @@ def apply_suggestion_change(suggestion):
                     changes['caution_phrases'] = settings['prompt_modifications']['caution']
         
         # Save updated settings
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return changes
         
@@ -365,14 +518,7 @@ def undo_suggestion(suggestion_id):
     Undo an approved suggestion's changes
     """
     with suggestion_lock:
-        state = load_suggestions_state()
-        
-        # Find in approved
-        suggestion = None
-        for i, s in enumerate(state['approved']):
-            if s.get('suggestion_id') == suggestion_id:
-                suggestion = state['approved'].pop(i)
-                break
+        suggestion = fetch_suggestion(suggestion_id, 'approved')
         
         if not suggestion:
             return {'status': 'error', 'message': 'Approved suggestion not found'}
@@ -384,9 +530,8 @@ def undo_suggestion(suggestion_id):
         # Move back to rejected with note
         suggestion['status'] = 'undone'
         suggestion['rejection_reason'] = 'Manually undone by user'
-        state['rejected'].append(suggestion)
-        
-        save_suggestions_state(state)
+        with suggestion_transaction() as cursor:
+            update_suggestion_status(cursor, suggestion_id, 'undone', suggestion)
         
         return {'status': 'success', 'reverted': reverted}
 
@@ -406,8 +551,7 @@ def revert_settings(applied_changes):
                 settings[key] = change['old']
                 reverted[key] = change['old']
         
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        write_settings(settings)
         
         return reverted
     except Exception as e:
@@ -415,39 +559,40 @@ def revert_settings(applied_changes):
 
 
 def get_current_metrics():
-    """Get current performance metrics for baseline comparison"""
+    """
+    Get current performance metrics for baseline comparison
+    Memoized for METRICS_CACHE_SECONDS
+    """
+    now_mono = time.monotonic()
+    if _metrics_cache['metrics'] is not None and now_mono - _metrics_cache['checked_at'] < METRICS_CACHE_SECONDS:
+        return dict(_metrics_cache['metrics'])
+    
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        row = read_query('''
             SELECT 
                 COUNT(*) as total,
                 SUM(CASE WHEN outcome = 'win' THEN 1 ELSE 0 END) as wins
             FROM signals
             WHERE outcome IN ('win', 'loss') AND is_valid = 1
-        ''')
-        
-        row = cursor.fetchone()
-        conn.close()
+        ''')[0]
         
         total = row['total'] or 0
         wins = row['wins'] or 0
         
-        return {
+        metrics = {
             'total_trades': total,
             'win_rate': round(wins / total * 100, 1) if total > 0 else 0
         }
+        _metrics_cache['checked_at'] = now_mono
+        _metrics_cache['metrics'] = metrics
+        return dict(metrics)
     except:
         return {'total_trades': 0, 'win_rate': 0}
 
 
-def update_suggestion_status(suggestion_id, status, suggestion_data):
-    """Update suggestion in database"""
+def update_suggestion_status(cursor, suggestion_id, status, suggestion_data):
+    """Update suggestion in database (on the caller's cursor - caller commits)"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
         cursor.execute('''
             UPDATE coach_suggestions
             SET status = ?,
@@ -466,9 +611,6 @@ def update_suggestion_status(suggestion_id, status, suggestion_data):
             suggestion_data.get('baseline_trades'),
             suggestion_id
         ))
-        
-        conn.commit()
-        conn.close()
     except Exception as e:
         print(f"⚠️  Error updating suggestion status: {e}")
 
@@ -479,14 +621,7 @@ def measure_suggestion_impact(suggestion_id):
     Called after enough new trades to compare
     """
     with suggestion_lock:
-        state = load_suggestions_state()
-        
-        # Find in approved
-        suggestion = None
-        for s in state['approved']:
-            if s.get('suggestion_id') == suggestion_id:
-                suggestion = s
-                break
+        suggestion = fetch_suggestion(suggestion_id, 'approved')
         
         if not suggestion:
             return None
@@ -511,9 +646,8 @@ def measure_suggestion_impact(suggestion_id):
         projected = suggestion.get('projected_impact', '')
         
         # Extract projected number if possible
-        import re
         projected_num = None
-        match = re.search(r'([+-]?\d+)', projected)
+        match = PROJECTED_NUM_RE.search(projected or '')
         if match:
             projected_num = int(match.group(1))
         
@@ -528,11 +662,17 @@ def measure_suggestion_impact(suggestion_id):
         }
         
         # Update suggestion with results
-        suggestion['post_win_rate'] = current['win_rate']
-        suggestion['post_trades'] = current['total_trades']
-        suggestion['actual_impact'] = json.dumps(result)
-        
-        save_suggestions_state(state)
+        try:
+            conn = get_connection()
+            conn.execute('''
+                UPDATE coach_suggestions
+                SET post_win_rate = ?, post_trades = ?, actual_impact = ?
+                WHERE suggestion_id = ?
+            ''', (current['win_rate'], current['total_trades'], json.dumps(result), suggestion_id))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"⚠️  Error saving suggestion impact: {e}")
         
         return result
 
@@ -540,33 +680,33 @@ def measure_suggestion_impact(suggestion_id):
 def get_history(limit=50):
     """Get suggestion history (approved and rejected)"""
     with suggestion_lock:
-        state = load_suggestions_state()
-        
-        history = []
-        
-        for s in state.get('approved', []):
-            s['list_type'] = 'approved'
-            history.append(s)
-        
-        for s in state.get('rejected', []):
-            s['list_type'] = 'rejected'
-            history.append(s)
-        
         # Sort by reviewed_at descending
-        history.sort(key=lambda x: x.get('reviewed_at', ''), reverse=True)
+        rows = read_query('''
+            SELECT * FROM coach_suggestions
+            WHERE status IN ('approved', 'rejected', 'undone')
+            ORDER BY reviewed_at DESC
+            LIMIT ?
+        ''', (limit,))
+        history = [suggestion_from_row(row) for row in rows]
+        
+        for s in history:
+            s['list_type'] = 'approved' if s['status'] == 'approved' else 'rejected'
         
-        return history[:limit]
+        return history
 
 
 def get_stats():
     """Get suggestion statistics"""
     with suggestion_lock:
+        rows = read_query('SELECT status, COUNT(*) as count FROM coach_suggestions GROUP BY status')
+        counts = {row['status']: row['count'] for row in rows}
+        
         state = load_suggestions_state()
         
         return {
-            'pending_count': len(state.get('pending', [])),
-            'approved_count': len(state.get('approved', [])),
-            'rejected_count': len(state.get('rejected', [])),
+            'pending_count': counts.get('pending', 0),
+            'approved_count': counts.get('approved', 0),
+            'rejected_count': counts.get('rejected', 0) + counts.get('undone', 0),
             'changes_this_week': state.get('changes_this_week', 0),
             'last_analysis': state.get('last_analysis')
         }
@@ -575,16 +715,17 @@ def get_stats():
 def clear_old_suggestions(days=30):
     """Clear suggestions older than N days"""
     with suggestion_lock:
-        state = load_suggestions_state()
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         
-        # Clear old rejected
-        state['rejected'] = [
-            s for s in state.get('rejected', [])
-            if s.get('reviewed_at', '') > cutoff
-        ]
-        
-        save_suggestions_state(state)
+        # Clear old rejected - a range scan on the (status, reviewed_at) index
+        conn = get_connection()
+        conn.execute('''
+            DELETE FROM coach_suggestions
+            WHERE status IN ('rejected', 'undone')
+              AND (reviewed_at <= ? OR reviewed_at IS NULL)
+        ''', (cutoff,))
+        conn.commit()
+        conn.close()
 
 
 # Initialize on import
@@ -12,6 +12,8 @@ Trading Windows (All times EST):
 """
 
 from datetime import datetime, time
+from functools import lru_cache
+import time as time_module
 import pytz
 
 EST = pytz.timezone('America/New_York')
@@ -96,11 +98,48 @@ TIERS = {
 }
 
 
+# Tier boundaries as minutes of the day (the time objects are kept for display)
+for _tier in TIERS.values():
+    _tier['start_min'] = _tier['start'].hour * 60 + _tier['start'].minute
+    _tier['end_min'] = _tier['end'].hour * 60 + _tier['end'].minute
+
+
+def _build_minute_table():
+    """Tier for every minute of the EST day (BLOCKED wraps past midnight)"""
+    table = [None] * 1440
+    for tier in TIERS.values():
+        start, end = tier['start_min'], tier['end_min']
+        minutes = range(start, end) if start < end else [*range(start, 1440), *range(0, end)]
+        for m in minutes:
+            table[m] = tier
+    return table
+
+
+_MINUTE_TO_TIER = _build_minute_table()
+
+# Tiers only change on the minute - remember the last lookup
+_tier_cache = {'minute': None, 'tier': None}
+
+# EST/EDT offset from UTC in seconds, valid until `expires` (epoch seconds)
+_offset_cache = {'expires': 0, 'offset': 0}
+
+
 def get_est_now():
     """Get current time in EST"""
     return datetime.now(EST)
 
 
+def _est_offset(now_ts):
+    """
+    UTC offset of EST in seconds - DST switches on the hour, so the
+    offset is only recomputed once the UTC hour rolls over
+    """
+    if now_ts >= _offset_cache['expires']:
+        _offset_cache['offset'] = datetime.fromtimestamp(now_ts, EST).utcoffset().total_seconds()
+        _offset_cache['expires'] = (now_ts // 3600 + 1) * 3600
+    return _offset_cache['offset']
+
+
 def get_current_tier():
     """
     Determine current trading tier based on EST time.
@@ -108,36 +147,15 @@ def get_current_tier():
     Returns:
         dict: Tier configuration with all settings
     """
-    now = get_est_now()
-    current_time = now.time()
-    
-    # Check each tier in order
-    # PRIME: 9:30 AM - 11:30 AM
-    if time(9, 30) <= current_time < time(11, 30):
-        return TIERS['PRIME']
-    
-    # MIDDAY: 11:30 AM - 3:30 PM
-    if time(11, 30) <= current_time < time(15, 30):
-        return TIERS['MIDDAY']
+    now_ts = time_module.time()
+    minute = int(now_ts) // 60
+    if _tier_cache['minute'] == minute:
+        return _tier_cache['tier']
     
-    # CLOSE: 3:30 PM - 5:00 PM
-    if time(15, 30) <= current_time < time(17, 0):
-        return TIERS['CLOSE']
-    
-    # EVENING: 5:00 PM - 9:00 PM
-    if time(17, 0) <= current_time < time(21, 0):
-        return TIERS['EVENING']
-    
-    # BLOCKED: 9:00 PM - 6:00 AM (crosses midnight)
-    if current_time >= time(21, 0) or current_time < time(6, 0):
-        return TIERS['BLOCKED']
-    
-    # PREMARKET: 6:00 AM - 9:30 AM
-    if time(6, 0) <= current_time < time(9, 30):
-        return TIERS['PREMARKET']
-    
-    # Fallback (shouldn't happen)
-    return TIERS['MIDDAY']
+    tier = _MINUTE_TO_TIER[int((now_ts + _est_offset(now_ts)) // 60) % 1440]
+    _tier_cache['minute'] = minute
+    _tier_cache['tier'] = tier
+    return tier
 
 
 def is_trading_blocked():
@@ -221,22 +239,40 @@ def get_session_window():
         str: Formatted time window (e.g., "9:30 AM - 11:30 AM")
     """
     tier = get_current_tier()
-    start = tier['start']
-    end = tier['end']
+    return f"{_format_time(tier['start'])} - {_format_time(tier['end'])}"
+
+
+@lru_cache(maxsize=16)
+def _format_time(t):
+    """Display form of a tier boundary, e.g. "9:30 AM" or "5 PM" """
+    hour = t.hour
+    minute = t.minute
+    am_pm = 'AM' if hour < 12 else 'PM'
+    if hour > 12:
+        hour -= 12
+    elif hour == 0:
+        hour = 12
+    if minute == 0:
+        return f"{hour} {am_pm}"
+    return f"{hour}:{minute:02d} {am_pm}"
+
+
+def _extended_hours_warning(tier):
+    """Warning text for a tier (empty when it needs no warning)"""
+    if not tier.get('warning', False):
+        return ""
     
-    def format_time(t):
-        hour = t.hour
-        minute = t.minute
-        am_pm = 'AM' if hour < 12 else 'PM'
-        if hour > 12:
-            hour -= 12
-        elif hour == 0:
-            hour = 12
-        if minute == 0:
-            return f"{hour} {am_pm}"
-        return f"{hour}:{minute:02d} {am_pm}"
+    if tier.get('blocked', False):
+        return "⛔ **OVERNIGHT - NO SIGNALS**\nTrading blocked from 9 PM - 6 AM EST"
     
-    return f"{format_time(start)} - {format_time(end)}"
+    return """⚠️ **EXTENDED HOURS NOTICE**
+• Lower liquidity - wider spreads expected
+• Expect 1-3 tick slippage on entry/exit
+• Consider waiting for RTH if not urgent"""
+
+
+# Warning text only depends on the tier - build it once per tier
+_EXTENDED_HOURS_WARNINGS = {tier['name']: _extended_hours_warning(tier) for tier in TIERS.values()}
 
 
 def get_extended_hours_warning():
@@ -246,23 +282,13 @@ def get_extended_hours_warning():
     Returns:
         str: Warning message or empty string
     """
-    if not should_show_warning():
-        return ""
-    
-    tier = get_current_tier()
-    
-    if tier.get('blocked', False):
-        return "⛔ **OVERNIGHT - NO SIGNALS**\nTrading blocked from 9 PM - 6 AM EST"
-    
-    return """⚠️ **EXTENDED HOURS NOTICE**
-• Lower liquidity - wider spreads expected
-• Expect 1-3 tick slippage on entry/exit
-• Consider waiting for RTH if not urgent"""
+    return _EXTENDED_HOURS_WARNINGS[get_current_tier()['name']]
 
 
+@lru_cache(maxsize=1)
 def get_tier_summary():
     """
-    Get a summary of all tiers for display/logging.
+    Get a summary of all tiers for display/logging (built once - TIERS is static).
     
     Returns:
         str: Formatted tier summary